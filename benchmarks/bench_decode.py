@@ -0,0 +1,105 @@
+"""Microbenchmark of the plate message decoders against the voluptuous schemas.
+
+Run from the repository root, in a Home Assistant development environment:
+
+    python -m benchmarks.bench_decode
+"""
+import json
+import timeit
+
+from custom_components.openhasp import (
+    HASP_EVENT_SCHEMA,
+    HASP_LWT_SCHEMA,
+    HASP_PAGE_SCHEMA,
+    HASP_STATUSUPDATE_SCHEMA,
+)
+from custom_components.openhasp.common import HASP_IDLE_SCHEMA
+from custom_components.openhasp.decode import (
+    decode_backlight,
+    decode_event,
+    decode_idle,
+    decode_light,
+    decode_lwt,
+    decode_moodlight,
+    decode_page,
+    decode_state,
+    decode_statusupdate,
+)
+from custom_components.openhasp.light import (
+    HASP_BACKLIGHT_SCHEMA,
+    HASP_LIGHT_SCHEMA,
+    HASP_MOODLIGHT_SCHEMA,
+)
+from custom_components.openhasp.switch import HASP_RELAY_SCHEMA
+
+NUMBER = 20000
+REPEAT = 5
+
+CASES = [
+    (
+        "event",
+        '{"event":"changed","val":42}',
+        lambda payload: HASP_EVENT_SCHEMA(json.loads(payload)),
+        decode_event,
+    ),
+    ("idle", "short", HASP_IDLE_SCHEMA, decode_idle),
+    ("page", "3", HASP_PAGE_SCHEMA, decode_page),
+    ("LWT", "online", HASP_LWT_SCHEMA, decode_lwt),
+    (
+        "relay",
+        '{"state":"on"}',
+        lambda payload: HASP_RELAY_SCHEMA(json.loads(payload)),
+        decode_state,
+    ),
+    (
+        "light",
+        '{"state":1,"brightness":128}',
+        lambda payload: HASP_LIGHT_SCHEMA(json.loads(payload)),
+        decode_light,
+    ),
+    (
+        "backlight",
+        '{"state":"on","brightness":255}',
+        lambda payload: HASP_BACKLIGHT_SCHEMA(json.loads(payload)),
+        decode_backlight,
+    ),
+    (
+        "moodlight",
+        '{"state":"on","r":255,"g":128,"b":0,"brightness":200,"color":"#FF8000"}',
+        lambda payload: HASP_MOODLIGHT_SCHEMA(json.loads(payload)),
+        decode_moodlight,
+    ),
+    (
+        "statusupdate",
+        '{"node":"plate","idle":0,"version":"0.7.0-rc11","uptime":1234,'
+        '"ssid":"wifi","rssi":-60,"ip":"192.168.1.2","mac":"AA:BB:CC:DD:EE:FF",'
+        '"heapFree":100000,"heapFrag":10,"core":"v4.4","canUpdate":"false",'
+        '"page":1,"numPages":12,"tftDriver":"ILI9341","tftWidth":240,'
+        '"tftHeight":320}',
+        lambda payload: HASP_STATUSUPDATE_SCHEMA(json.loads(payload)),
+        decode_statusupdate,
+    ),
+]
+
+
+def _best(func, payload):
+    """Return the best time per call in microseconds."""
+    runs = timeit.repeat(lambda: func(payload), number=NUMBER, repeat=REPEAT)
+    return min(runs) / NUMBER * 1e6
+
+
+def main():
+    """Run the benchmark."""
+    print(f"{'message':<14}{'voluptuous':>12}{'decode':>12}{'speedup':>10}")
+    for name, payload, schema, decoder in CASES:
+        assert schema(payload) == decoder(payload), name
+
+        baseline = _best(schema, payload)
+        fast = _best(decoder, payload)
+        print(
+            f"{name:<14}{baseline:>9.2f} us{fast:>9.2f} us{baseline / fast:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
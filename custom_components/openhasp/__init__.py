@@ -1,38 +1,71 @@
 """HASP components module."""
+import asyncio
 import hashlib
 import json
 import logging
 import os
 import pathlib
 import re
+import time
 
 from homeassistant.helpers.device_registry import (
     CONNECTION_NETWORK_MAC,
     format_mac,
 )
-from homeassistant.components.mqtt import async_subscribe, async_publish
+from homeassistant.components.mqtt import async_publish
 import homeassistant.components.mqtt as mqtt
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
 from homeassistant.components.button import DOMAIN as BUTTON_DOMAIN
 from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
 from homeassistant.components.number import DOMAIN as NUMBER_DOMAIN
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
 from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
-from homeassistant.const import CONF_NAME, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.const import (
+    ATTR_UNIT_OF_MEASUREMENT,
+    CONF_NAME,
+    CONF_PATH,
+    STATE_CLOSED,
+    STATE_HOME,
+    STATE_LOCKED,
+    STATE_NOT_HOME,
+    STATE_OFF,
+    STATE_ON,
+    STATE_OPEN,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    STATE_UNLOCKED,
+)
 from homeassistant.core import callback, Context
 from homeassistant.exceptions import TemplateError
-from homeassistant.helpers import device_registry as dr, entity_registry
+from homeassistant.helpers import device_registry as dr, discovery, entity_registry
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_component import EntityComponent
-from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+from homeassistant.helpers.event import (
+    TrackTemplate,
+    async_call_later,
+    async_track_state_change_event,
+    async_track_template_result,
+)
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.reload import async_integration_yaml_config
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import Script
+from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.template import Template
 from homeassistant.util import slugify
+import aiohttp
 import jsonschema
 import voluptuous as vol
 
-from .common import HASP_IDLE_SCHEMA
+from .common import (
+    PLATE_LWT,
+    async_get_channel,
+    async_get_router,
+    async_get_write_buffer,
+)
 from .const import (
     ATTR_COMMAND_KEYWORD,
     ATTR_COMMAND_PARAMETERS,
@@ -47,35 +80,52 @@ from .const import (
     ATTR_PAGE,
     ATTR_PATH,
     ATTR_WIDTH,
+    CONF_ASSETS,
     CONF_COMPONENT,
     CONF_EVENT,
+    CONF_GROUP_TOPIC,
+    CONF_GROUPS,
     CONF_HWID,
     CONF_OBJECTS,
     CONF_OBJID,
     CONF_PAGES,
     CONF_PAGES_PATH,
     CONF_PLATE,
+    CONF_PLATES,
     CONF_PROPERTIES,
+    CONF_RETAIN_STATE,
+    CONF_SLIM_ATTRIBUTES,
     CONF_TOPIC,
     CONF_TRACK,
     CONF_SUBTOPIC,
+    CONF_UPLOAD_PAGES,
+    DATA_GROUPS,
     DATA_IMAGES,
     DATA_LISTENER,
+    DATA_YAML_CONFIG,
     DISCOVERED_MANUFACTURER,
     DISCOVERED_MODEL,
     DISCOVERED_URL,
     DISCOVERED_VERSION,
     DOMAIN,
+    ENABLE_OBJECTS_CONCURRENCY,
     EVENT_HASP_PLATE_OFFLINE,
     EVENT_HASP_PLATE_ONLINE,
+    FINGERPRINT_TIMEOUT,
     HASP_EVENT,
+    HASP_EVENT_CHANGED,
     HASP_EVENT_DOWN,
     HASP_EVENT_RELEASE,
     HASP_EVENT_UP,
     HASP_EVENTS,
+    HASP_FINGERPRINT_OBJ,
     HASP_LWT,
+    HASP_MAX_PAYLOAD,
     HASP_NUM_PAGES,
     HASP_ONLINE,
+    HASP_PAGES_FILE,
+    HASP_SLIM_ATTRIBUTES,
+    HASP_TEXT,
     HASP_VAL,
     MAJOR,
     MINOR,
@@ -87,9 +137,21 @@ from .const import (
     SERVICE_PAGE_NEXT,
     SERVICE_PAGE_PREV,
     SERVICE_PUSH_IMAGE,
+    SERVICE_RELOAD,
     SERVICE_WAKEUP,
+    SIGNAL_PLATE_OFFLINE,
+    SIGNAL_PLATE_ONLINE,
+    SIGNAL_PLATES_CHANGED,
+    STATE_WRITE_DELAY,
+    STATUSUPDATE_TIMEOUT,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    UPTIME_TOLERANCE,
 )
+from .decode import decode_event
 from .image import ImageServeView, image_to_rgb565
+from .tick import async_get_time_tick
+from .upload import HASPAssetSync, async_upload_file
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -102,6 +164,79 @@ PLATFORMS = [
 ]
 
 
+# Entity states mapped to the val property of a tracking object
+TRACK_BINARY_STATES = {
+    STATE_ON: 1,
+    STATE_OFF: 0,
+    STATE_OPEN: 1,
+    STATE_CLOSED: 0,
+    STATE_HOME: 1,
+    STATE_NOT_HOME: 0,
+    STATE_LOCKED: 1,
+    STATE_UNLOCKED: 0,
+}
+
+
+def track_state_properties(state):
+    """Map the state of a tracked entity to HASP-LVGL object properties.
+
+    On/off-like states set val to 1 or 0. Other states set text to the state
+    with its unit, and val to the rounded state when it is a finite number.
+    Both are sent whatever the object type, a property template overrides
+    them.
+    """
+    if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        return {}
+
+    if state.state in TRACK_BINARY_STATES:
+        return {HASP_VAL: TRACK_BINARY_STATES[state.state]}
+
+    properties = {}
+    try:
+        properties[HASP_VAL] = round(float(state.state))
+    except (ValueError, OverflowError):
+        pass
+
+    unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    properties[HASP_TEXT] = f"{state.state} {unit}" if unit else state.state
+
+    return properties
+
+
+def pages_fingerprint(lines):
+    """Return a fingerprint of the pages payload sent to a plate."""
+    return hashlib.sha256("".join(lines).encode("utf-8")).hexdigest()
+
+
+def fingerprint_line(fingerprint):
+    """Return the JSONL line of the hidden object holding the design fingerprint."""
+    page, obj_id = re.match("p([0-9]+)b([0-9]+)", HASP_FINGERPRINT_OBJ).groups()
+    return (
+        json.dumps(
+            {
+                "page": int(page),
+                "id": int(obj_id),
+                "obj": "label",
+                "hidden": 1,
+                HASP_TEXT: fingerprint,
+            }
+        )
+        + "\n"
+    )
+
+
+def config_signature(value):
+    """Return a comparable form of a configuration, templates by their source."""
+    if isinstance(value, Template):
+        # Template equality depends on the attached hass
+        return (Template, value.template)
+    if isinstance(value, dict):
+        return {key: config_signature(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [config_signature(item) for item in value]
+    return value
+
+
 def hasp_object(value):
     """Validade HASP-LVGL object format."""
     if re.match("p[0-9]+b[0-9]+", value):
@@ -124,14 +259,42 @@ OBJECT_SCHEMA = vol.Schema(
     }
 )
 
+ASSET_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_PATH): cv.string,
+        vol.Optional(CONF_NAME): vol.All(
+            cv.string, vol.Match("^/", msg="Plate file names start with /")
+        ),
+    }
+)
+
 PLATE_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_OBJECTS): vol.All(cv.ensure_list, [OBJECT_SCHEMA]),
+        vol.Optional(CONF_ASSETS, default=[]): vol.All(
+            cv.ensure_list, [ASSET_SCHEMA]
+        ),
+        vol.Optional(CONF_GROUP_TOPIC): cv.string,
     },
 )
 
+GROUP_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_PLATES): vol.All(cv.ensure_list, [cv.slug]),
+        vol.Optional(CONF_TOPIC): cv.string,
+    }
+)
+
 CONFIG_SCHEMA = vol.Schema(
-    {DOMAIN: vol.Schema({cv.slug: PLATE_SCHEMA})}, extra=vol.ALLOW_EXTRA
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(CONF_GROUPS): cv.schema_with_slug_keys(GROUP_SCHEMA),
+                cv.slug: PLATE_SCHEMA,
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
 )
 
 # JSON Messages from HASP schemas
@@ -170,6 +333,25 @@ PUSH_IMAGE_SCHEMA = cv.make_entity_service_schema(
 )
 
 
+PAGE_CHANGE_SCHEMA = cv.make_entity_service_schema({vol.Required(ATTR_PAGE): int})
+
+CLEAR_PAGE_SCHEMA = cv.make_entity_service_schema({vol.Optional(ATTR_PAGE): int})
+
+COMMAND_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_COMMAND_KEYWORD): cv.string,
+        vol.Optional(ATTR_COMMAND_PARAMETERS, default=""): cv.string,
+    }
+)
+
+CONFIG_SERVICE_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_CONFIG_SUBMODULE): cv.string,
+        vol.Required(ATTR_CONFIG_PARAMETERS): cv.string,
+    }
+)
+
+
 async def async_setup(hass, config):
     """Wait for MQTT to become available before starting."""
     await mqtt.async_wait_for_mqtt_client(hass)
@@ -205,9 +387,7 @@ async def async_setup(hass, config):
         "async_change_page_prev",
     )
     component.async_register_entity_service(
-        SERVICE_PAGE_CHANGE,
-        cv.make_entity_service_schema({vol.Required(ATTR_PAGE): int}),
-        "async_change_page",
+        SERVICE_PAGE_CHANGE, PAGE_CHANGE_SCHEMA, "async_change_page"
     )
     component.async_register_entity_service(
         SERVICE_LOAD_PAGE,
@@ -215,25 +395,13 @@ async def async_setup(hass, config):
         "async_load_page",
     )
     component.async_register_entity_service(
-        SERVICE_CLEAR_PAGE,
-        cv.make_entity_service_schema({vol.Optional(ATTR_PAGE): int}),
-        "async_clearpage",
+        SERVICE_CLEAR_PAGE, CLEAR_PAGE_SCHEMA, "async_clearpage"
     )
     component.async_register_entity_service(
-        SERVICE_COMMAND,
-        cv.make_entity_service_schema({
-            vol.Required(ATTR_COMMAND_KEYWORD): cv.string,
-            vol.Optional(ATTR_COMMAND_PARAMETERS, default=""): cv.string,
-        }),
-        "async_command_service",
+        SERVICE_COMMAND, COMMAND_SCHEMA, "async_command_service"
     )
     component.async_register_entity_service(
-        SERVICE_CONFIG,
-        cv.make_entity_service_schema({
-            vol.Required(ATTR_CONFIG_SUBMODULE): cv.string,
-            vol.Required(ATTR_CONFIG_PARAMETERS): cv.string,
-        }),
-        "async_config_service",
+        SERVICE_CONFIG, CONFIG_SERVICE_SCHEMA, "async_config_service"
     )
     component.async_register_entity_service(
         SERVICE_PUSH_IMAGE,
@@ -241,14 +409,85 @@ async def async_setup(hass, config):
         "async_push_image",
     )
 
+    # Groups of plates are sensors counting their members
+    hass.async_create_task(
+        discovery.async_load_platform(
+            hass,
+            SENSOR_DOMAIN,
+            DOMAIN,
+            {CONF_GROUPS: conf.get(CONF_GROUPS, {})},
+            config,
+        )
+    )
+
+    async def async_reload_service(call):
+        """Reload the objects of all plates from YAML."""
+        async_invalidate_yaml_config(hass)
+        hass_config = await async_get_yaml_config(hass)
+        if not hass_config:
+            return
+
+        for plate, plate_entity in hass.data[DOMAIN][CONF_PLATE].items():
+            if not _has_plate_config(hass_config, plate):
+                _LOGGER.error("No YAML configuration for %s, not reloaded", plate)
+                continue
+            await plate_entity.async_reload_objects(
+                hass_config[DOMAIN][slugify(plate)]
+            )
+
+        if DATA_GROUPS in hass.data[DOMAIN]:
+            await hass.data[DOMAIN][DATA_GROUPS](
+                hass_config[DOMAIN].get(CONF_GROUPS, {})
+            )
+
+    async_register_admin_service(hass, DOMAIN, SERVICE_RELOAD, async_reload_service)
+
     hass.data[DOMAIN][DATA_IMAGES] = dict()
     hass.http.register_view(ImageServeView)
 
     return True
 
 
+async def async_get_yaml_config(hass):
+    """Return the YAML configuration, parsed once and shared by all plates."""
+    task = hass.data[DOMAIN].get(DATA_YAML_CONFIG)
+    if task is None:
+        task = hass.data[DOMAIN][DATA_YAML_CONFIG] = hass.async_create_task(
+            async_integration_yaml_config(hass, DOMAIN)
+        )
+
+    try:
+        hass_config = await task
+    except Exception:
+        # Don't keep a failed parse for the next setup
+        if hass.data[DOMAIN].get(DATA_YAML_CONFIG) is task:
+            async_invalidate_yaml_config(hass)
+        raise
+
+    if hass_config is None:
+        # Invalid configuration, try again next time
+        async_invalidate_yaml_config(hass)
+    return hass_config
+
+
+@callback
+def async_invalidate_yaml_config(hass):
+    """Discard the cached YAML configuration."""
+    hass.data[DOMAIN].pop(DATA_YAML_CONFIG, None)
+
+
+def _has_plate_config(hass_config, plate):
+    """Return True if the YAML configuration has an entry for the plate."""
+    return bool(hass_config) and slugify(plate) in hass_config.get(DOMAIN, {})
+
+
 async def async_update_options(hass, entry):
     """Handle options update."""
+    plate_entity = hass.data[DOMAIN][CONF_PLATE].get(entry.data[CONF_NAME])
+    if plate_entity is not None and not entry.options.get(CONF_RETAIN_STATE, False):
+        # Retained properties would be replayed to the plate on every reconnect
+        await plate_entity.async_clear_retained()
+
     _LOGGER.debug("Reloading")
     await hass.config_entries.async_reload(entry.entry_id)
 
@@ -258,9 +497,14 @@ async def async_setup_entry(hass, entry) -> bool:
     plate = entry.data[CONF_NAME]
     _LOGGER.debug("Setup %s", plate)
 
-    hass_config = await async_integration_yaml_config(hass, DOMAIN)
+    hass_config = await async_get_yaml_config(hass)
 
-    if DOMAIN not in hass_config or slugify(plate) not in hass_config[DOMAIN]:
+    if not _has_plate_config(hass_config, plate):
+        # The plate might have been added to YAML after the cache was filled
+        async_invalidate_yaml_config(hass)
+        hass_config = await async_get_yaml_config(hass)
+
+    if not _has_plate_config(hass_config, plate):
         _LOGGER.error(
             "No YAML configuration for %s, \
             please create an entry under 'openhasp' with the slug: %s",
@@ -289,6 +533,7 @@ async def async_setup_entry(hass, entry) -> bool:
     plate_entity = SwitchPlate(hass, config, entry)
     await component.async_add_entities([plate_entity])
     hass.data[DOMAIN][CONF_PLATE][plate] = plate_entity
+    async_dispatcher_send(hass, SIGNAL_PLATES_CHANGED)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -312,13 +557,16 @@ async def async_unload_entry(hass, entry):
 
     # Remove Plate entity
     del hass.data[DOMAIN][CONF_PLATE][plate]
+    async_dispatcher_send(hass, SIGNAL_PLATES_CHANGED)
+
+    # The YAML configuration is parsed again when the entry is set up again
+    async_invalidate_yaml_config(hass)
 
     return True
 
 
 async def async_remove_entry(hass, entry):
-    plate = entry.data[CONF_NAME]
-
+    """Remove the plate device, entity and stored data of a config entry."""
     # Only remove services if it is the last
     if len(hass.data[DOMAIN][CONF_PLATE]) == 1:
         _LOGGER.debug("removing services")
@@ -329,6 +577,7 @@ async def async_remove_entry(hass, entry):
         hass.services.async_remove(DOMAIN, SERVICE_LOAD_PAGE)
         hass.services.async_remove(DOMAIN, SERVICE_CLEAR_PAGE)
         hass.services.async_remove(DOMAIN, SERVICE_COMMAND)
+        hass.services.async_remove(DOMAIN, SERVICE_RELOAD)
 
     device_registry = dr.async_get(hass)
     dev = device_registry.async_get_device(
@@ -340,7 +589,26 @@ async def async_remove_entry(hass, entry):
 
     # Component does not remove entity from entity_registry, so we must do it
     registry = entity_registry.async_get(hass)
-    registry.async_remove(hass.data[DOMAIN][CONF_PLATE][plate].entity_id)
+    entity_id = registry.async_get_entity_id(DOMAIN, DOMAIN, entry.data[CONF_HWID])
+    if entity_id is not None:
+        registry.async_remove(entity_id)
+
+    hwid = entry.data[CONF_HWID]
+    store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{hwid}")
+
+    if entry.options.get(CONF_RETAIN_STATE, False):
+        # Clear the retained properties, known from the property cache
+        topic = entry.data[CONF_TOPIC]
+        cache = await store.async_load() or {}
+        await async_get_write_buffer(hass, topic).async_clear_topics(
+            f"{topic}/command/{key}.{_property}"
+            for key, properties in cache.items()
+            for _property in properties
+        )
+
+    # Remove the property cache and asset manifest of the plate
+    await store.async_remove()
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{hwid}.assets").async_remove()
 
 
 # pylint: disable=R0902
@@ -355,27 +623,85 @@ class SwitchPlate(RestoreEntity):
         self._pages_jsonl = entry.options.get(
             CONF_PAGES_PATH, entry.data.get(CONF_PAGES_PATH)
         )
+        self._upload_pages = entry.options.get(CONF_UPLOAD_PAGES, False)
+        self._group_topic = config.get(CONF_GROUP_TOPIC)
 
         self._objects = []
         for obj in config[CONF_OBJECTS]:
-            new_obj = HASPObject(hass, self._topic, obj)
-
-            self._objects.append(new_obj)
+            self._objects.append(self._create_object(hass, obj))
         self._statusupdate = {HASP_NUM_PAGES: entry.data[CONF_PAGES]}
         self._available = False
         self._page = 1
 
         self._subscriptions = []
+        self._buffer = async_get_write_buffer(hass, self._topic)
+        self._buffer.retain = entry.options.get(CONF_RETAIN_STATE, False)
+        # (uptime, monotonic time) of the last statusupdate, to detect restarts
+        self._session = None
+        self._last_session = None
+        self._statusupdate_waiter = None
+        self._design_fingerprint = None
+        # The plate rebooted since it was last seen online
+        self._rebooted = False
+        self._slim_attributes = entry.options.get(CONF_SLIM_ATTRIBUTES, False)
+        self._write_unsub = None
+        # Registered by async_setup_entry with the discovered version
+        self._device_info = self._device_metadata(entry.data[DISCOVERED_VERSION])
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.data[CONF_HWID]}")
+        self._assets = HASPAssetSync(
+            hass, entry.data[CONF_HWID], config.get(CONF_ASSETS, [])
+        )
 
         self._attr_unique_id = entry.data[CONF_HWID]
         self._attr_name = entry.data[CONF_NAME]
         self._attr_icon = "mdi:gesture-tap-box"
 
+    def _create_object(self, hass, config):
+        """Create an object of the plate."""
+        return HASPObject(
+            hass, self._topic, config, cache_updated=self._async_schedule_save
+        )
+
     def _read_file(self, path):
         """Executor helper to read file."""
         with open(path, "r") as src_file:
             return src_file.read()
 
+    @callback
+    def _async_schedule_save(self):
+        """Schedule saving the objects property cache."""
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self):
+        """Return the objects property cache to store."""
+        return {obj.cache_key: obj.cached_properties for obj in self._objects}
+
+    async def async_clear_retained(self):
+        """Clear the retained properties of all objects from the broker."""
+        if not self._buffer.retain:
+            return
+
+        _LOGGER.info("Clearing retained properties of %s", self._entry.data[CONF_NAME])
+        for obj in self._objects:
+            await self._buffer.async_clear_properties(obj)
+        self._buffer.retain = False
+
+    async def async_restore_cache(self):
+        """Restore the objects property cache saved on the last run."""
+        data = await self._store.async_load()
+        if not data:
+            return
+
+        for obj in self._objects:
+            produced = obj.produced_properties
+            for _property, result in data.get(obj.cache_key, {}).items():
+                # Drop properties removed from the configuration
+                if _property not in produced:
+                    continue
+                # Values rendered in this run are fresher
+                obj.cached_properties.setdefault(_property, result)
+
     @property
     def state(self):
         """Return the state of the component."""
@@ -386,6 +712,16 @@ class SwitchPlate(RestoreEntity):
         """Return if entity is available."""
         return self._available
 
+    @property
+    def topic(self):
+        """Return the base topic of the plate."""
+        return self._topic
+
+    @property
+    def group_topic(self):
+        """Return the group topic the plate listens on, if any."""
+        return self._group_topic
+
     async def async_will_remove_from_hass(self):
         """Run before entity is removed."""
         _LOGGER.debug("Remove plate %s", self._entry.data[CONF_NAME])
@@ -396,6 +732,13 @@ class SwitchPlate(RestoreEntity):
         for subscription in self._subscriptions:
             subscription()
 
+        if self._write_unsub is not None:
+            self._write_unsub()
+            self._write_unsub = None
+
+        # Don't lose the property cache waiting for the delayed save
+        await self._store.async_save(self._data_to_save())
+
     async def async_added_to_hass(self):
         """Run when entity about to be added."""
         await super().async_added_to_hass()
@@ -405,131 +748,161 @@ class SwitchPlate(RestoreEntity):
         )
         self.json_schema = json.loads(schema_file_contents)
 
+        await self.async_restore_cache()
+
         state = await self.async_get_last_state()
         if state and state.state not in [STATE_UNAVAILABLE, STATE_UNKNOWN, None]:
             self._page = int(state.state)
 
+        channel = async_get_channel(self.hass, self._topic)
+
         @callback
-        async def page_update_received(msg):
+        def page_update_received(page):
             """Process page state."""
-            try:
-                self._page = HASP_PAGE_SCHEMA(msg.payload)
-                _LOGGER.debug("Page changed to %s", self._page)
-                self.async_write_ha_state()
-            except vol.error.Invalid as err:
-                _LOGGER.error("%s in %s", err, msg.payload)
+            self._page = page
+            _LOGGER.debug("Page changed to %s", self._page)
+            self.async_schedule_write_ha_state()
 
         self._subscriptions.append(
-            await async_subscribe(
-                self.hass, f"{self._topic}/state/page", page_update_received
-            )
+            await channel.async_listen("page", page_update_received)
         )
 
         @callback
-        async def statusupdate_message_received(msg):
+        def statusupdate_message_received(message):
             """Process statusupdate."""
-
-            try:
-                message = HASP_STATUSUPDATE_SCHEMA(json.loads(msg.payload))
-
-                major, minor, patch = message["version"].split(".")[:3]
-                if (major, minor) != (MAJOR, MINOR):
-                    _LOGGER.warning(
-                        "%s firmware mismatch %s <> %s",
-                        self._entry.data[CONF_NAME],
-                        (major, minor),
-                        (MAJOR, MINOR),
-                    )
-                self._available = True
-                self._statusupdate = message
-
-                self._page = message[ATTR_PAGE]
-                self.async_write_ha_state()
-
-                # Update Plate device information
-                device_registry = dr.async_get(self.hass)
-                device_registry.async_get_or_create(
-                    config_entry_id=self._entry.entry_id,
-                    identifiers={(DOMAIN, self._entry.data[CONF_HWID])},
-                    manufacturer=self._entry.data[DISCOVERED_MANUFACTURER],
-                    model=self._entry.data[DISCOVERED_MODEL],
-                    configuration_url=self._entry.data.get(DISCOVERED_URL),
-                    sw_version=message["version"],
-                    name=self._entry.data[CONF_NAME],
+            major, minor, patch = message["version"].split(".")[:3]
+            if (major, minor) != (MAJOR, MINOR):
+                _LOGGER.warning(
+                    "%s firmware mismatch %s <> %s",
+                    self._entry.data[CONF_NAME],
+                    (major, minor),
+                    (MAJOR, MINOR),
                 )
+            self._available = True
+            self._statusupdate = {**message}
+            self._session = (message["uptime"], time.monotonic())
+            if self._statusupdate_waiter and not self._statusupdate_waiter.done():
+                self._statusupdate_waiter.set_result(message)
+
+            self._page = message[ATTR_PAGE]
+            self.async_schedule_write_ha_state()
 
-            except vol.error.Invalid as err:
-                _LOGGER.error("While processing status update: %s", err)
+            self.async_update_device(message["version"])
 
         self._subscriptions.append(
-            await async_subscribe(
-                self.hass,
-                f"{self._topic}/state/statusupdate",
-                statusupdate_message_received,
-            )
+            await channel.async_listen("statusupdate", statusupdate_message_received)
         )
         await async_publish(
             self.hass, f"{self._topic}/command", "statusupdate", qos=0, retain=False
         )
 
         @callback
-        async def idle_message_received(msg):
+        def idle_message_received(idle):
             """Process idle message."""
-            try:
-                self._statusupdate[ATTR_IDLE] = HASP_IDLE_SCHEMA(msg.payload)
-                self.async_write_ha_state()
-            except vol.error.Invalid as err:
-                _LOGGER.error("While processing idle message: %s", err)
+            self._statusupdate[ATTR_IDLE] = idle
+            self.async_schedule_write_ha_state()
 
         self._subscriptions.append(
-            await async_subscribe(
-                self.hass, f"{self._topic}/state/idle", idle_message_received
-            )
+            await channel.async_listen("idle", idle_message_received)
         )
 
-        @callback
-        async def lwt_message_received(msg):
+        async def lwt_message_received(message):
             """Process LWT."""
-            _LOGGER.debug("Received LWT = %s", msg.payload)
-            try:
-                message = HASP_LWT_SCHEMA(msg.payload)
-
-                if message == HASP_ONLINE:
-                    self._available = True
-                    self.hass.bus.async_fire(
-                        EVENT_HASP_PLATE_ONLINE,
-                        {CONF_PLATE: self._entry.data[CONF_HWID]},
-                    )
-                    if self._pages_jsonl:
-                        await self.async_load_page(self._pages_jsonl)
-                    else:
-                        await self.refresh()
+            _LOGGER.debug("Received LWT = %s", message)
 
-                    for obj in self._objects:
-                        await obj.enable_object()
+            if message == HASP_ONLINE:
+                self._available = True
+                self._buffer.online = True
+                self.hass.bus.async_fire(
+                    EVENT_HASP_PLATE_ONLINE,
+                    {CONF_PLATE: self._entry.data[CONF_HWID]},
+                )
+                async_dispatcher_send(
+                    self.hass,
+                    SIGNAL_PLATE_ONLINE.format(self._entry.data[CONF_HWID]),
+                )
+                if await self.async_plate_restarted():
+                    self._buffer.async_reset()
+                    await self.async_bring_up()
                 else:
-                    self._available = False
-                    self.hass.bus.async_fire(
-                        EVENT_HASP_PLATE_OFFLINE,
-                        {CONF_PLATE: self._entry.data[CONF_HWID]},
-                    )
-                    for obj in self._objects:
-                        await obj.disable_object()
-
-                self.async_write_ha_state()
+                    await self.async_resume()
+            else:
+                self._available = False
+                self._buffer.online = False
+                self._last_session = self._session
+                self.hass.bus.async_fire(
+                    EVENT_HASP_PLATE_OFFLINE,
+                    {CONF_PLATE: self._entry.data[CONF_HWID]},
+                )
+                async_dispatcher_send(
+                    self.hass,
+                    SIGNAL_PLATE_OFFLINE.format(self._entry.data[CONF_HWID]),
+                )
 
-            except vol.error.Invalid as err:
-                _LOGGER.error("While processing LWT: %s", err)
+            self.async_schedule_write_ha_state()
 
         self._subscriptions.append(
-            await async_subscribe(self.hass, f"{self._topic}/LWT", lwt_message_received)
+            await channel.async_listen(PLATE_LWT, lwt_message_received)
         )
 
+    def _device_metadata(self, sw_version):
+        """Return the Plate device information written to the registry."""
+        return {
+            "manufacturer": self._entry.data[DISCOVERED_MANUFACTURER],
+            "model": self._entry.data[DISCOVERED_MODEL],
+            "configuration_url": self._entry.data.get(DISCOVERED_URL),
+            "sw_version": sw_version,
+            "name": self._entry.data[CONF_NAME],
+        }
+
+    @callback
+    def async_update_device(self, sw_version):
+        """Update the Plate device information, only if it changed."""
+        device_info = self._device_metadata(sw_version)
+        if device_info == self._device_info:
+            return
+
+        _LOGGER.debug("Update device %s: %s", self._entry.data[CONF_NAME], device_info)
+        device_registry = dr.async_get(self.hass)
+        device_registry.async_get_or_create(
+            config_entry_id=self._entry.entry_id,
+            identifiers={(DOMAIN, self._entry.data[CONF_HWID])},
+            **device_info,
+        )
+        self._device_info = device_info
+
+    @callback
+    def async_schedule_write_ha_state(self):
+        """Write the state once for all plate messages received in a short window."""
+        if self._write_unsub is None:
+            self._write_unsub = async_call_later(
+                self.hass, STATE_WRITE_DELAY, self._async_write_state
+            )
+
+    @callback
+    def _async_write_state(self, _now):
+        """Write the scheduled state."""
+        self._write_unsub = None
+        self.async_write_ha_state()
+
+    @property
+    def statusupdate(self):
+        """Return the last statusupdate of the plate."""
+        return self._statusupdate
+
     @property
     def state_attributes(self):
         """Return the state attributes."""
         attributes = {}
 
+        if self._slim_attributes:
+            # The full statusupdate is available in the diagnostics
+            return {
+                key: self._statusupdate[key]
+                for key in HASP_SLIM_ATTRIBUTES
+                if key in self._statusupdate
+            }
+
         if self._statusupdate:
             attributes = {**attributes, **self._statusupdate}
 
@@ -648,41 +1021,207 @@ class SwitchPlate(RestoreEntity):
         """Refresh objects in the SwitchPlate."""
 
         _LOGGER.info("Refreshing %s", self._entry.data[CONF_NAME])
-        for obj in self._objects:
-            await obj.refresh()
+        await self.async_refresh_objects(self._objects)
 
         await self.async_change_page(self._page)
 
+    async def async_refresh_objects(self, objects, unsent_only=False):
+        """Send the cached values of objects to the plate."""
+        await self._buffer.async_publish_properties(
+            (
+                (obj, _property, result)
+                for obj in objects
+                for _property, result in obj.cached_properties.items()
+            ),
+            unsent_only=unsent_only,
+        )
+
+    async def async_reload_objects(self, config):
+        """Replace the objects whose configuration changed, keep the others."""
+        unmatched = {}
+        for obj in self._objects:
+            unmatched.setdefault(obj.obj_id, []).append(obj)
+
+        objects = []
+        created = []
+        for obj_config in config.get(CONF_OBJECTS, []):
+            candidates = unmatched.get(obj_config[CONF_OBJID], [])
+            signature = config_signature(obj_config)
+            obj = next((obj for obj in candidates if obj.signature == signature), None)
+            if obj is not None:
+                candidates.remove(obj)
+            else:
+                obj = self._create_object(self.hass, obj_config)
+                created.append(obj)
+            objects.append(obj)
+
+        self._group_topic = config.get(CONF_GROUP_TOPIC)
+        self._assets.assets = config.get(CONF_ASSETS, [])
+        if self._available:
+            await self.async_sync_assets()
+
+        removed = [obj for candidates in unmatched.values() for obj in candidates]
+        for obj in removed:
+            await obj.disable_object()
+            if self._buffer.retain:
+                await self._buffer.async_clear_properties(obj)
+
+        self._objects = objects
+        _LOGGER.info(
+            "Reloaded %s: %s objects created, %s removed",
+            self._entry.data[CONF_NAME],
+            len(created),
+            len(removed),
+        )
+
+        if self._available and created:
+            for obj in created:
+                obj.hold_updates = True
+            try:
+                await asyncio.gather(*(obj.enable_object() for obj in created))
+            finally:
+                for obj in created:
+                    obj.hold_updates = False
+            await self.async_refresh_objects(created)
+
+    async def async_plate_restarted(self):
+        """Return False if the plate kept its state since it went offline."""
+        last_session = self._last_session
+        self._last_session = None
+        self._rebooted = False
+        if last_session is None:
+            # Nothing known about the previous session
+            return True
+
+        self._statusupdate_waiter = self.hass.loop.create_future()
+        try:
+            await async_publish(
+                self.hass, f"{self._topic}/command", "statusupdate", qos=0, retain=False
+            )
+            message = await asyncio.wait_for(
+                self._statusupdate_waiter, STATUSUPDATE_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            _LOGGER.debug("%s: no statusupdate received", self._entry.data[CONF_NAME])
+            return True
+        finally:
+            self._statusupdate_waiter = None
+
+        last_uptime, last_seen = last_session
+        expected_uptime = last_uptime + time.monotonic() - last_seen
+        if message["uptime"] + UPTIME_TOLERANCE < expected_uptime:
+            _LOGGER.debug("%s: plate restarted", self._entry.data[CONF_NAME])
+            self._rebooted = True
+            return True
+
+        if self._pages_jsonl:
+            lines = await self.async_prepare_pages(self._pages_jsonl)
+            if lines is None or pages_fingerprint(lines) != self._design_fingerprint:
+                _LOGGER.debug("%s: design changed", self._entry.data[CONF_NAME])
+                return True
+
+        return False
+
+    async def async_resume(self):
+        """Resume a plate that kept its state, only send what changed meanwhile."""
+        _LOGGER.info("Resuming %s", self._entry.data[CONF_NAME])
+        for obj in self._objects:
+            await obj.enable_object()
+
+        await self._buffer.async_flush()
+
+    async def async_bring_up(self):
+        """Restore a plate that came online.
+
+        The pages are sent while objects set up their subscriptions and render
+        their templates, with results held back until the pages are loaded.
+        """
+        name = self._entry.data[CONF_NAME]
+        start = time.monotonic()
+        semaphore = asyncio.Semaphore(ENABLE_OBJECTS_CONCURRENCY)
+
+        async def enable_object(obj):
+            async with semaphore:
+                await obj.enable_object()
+
+        async def enable_objects():
+            await asyncio.gather(*(enable_object(obj) for obj in self._objects))
+            _LOGGER.debug(
+                "%s: %s objects enabled in %.3fs",
+                name,
+                len(self._objects),
+                time.monotonic() - start,
+            )
+
+        transferred = False
+
+        async def load_pages():
+            nonlocal transferred
+            skip_unchanged = self._upload_pages or not self._rebooted
+            if (
+                self._rebooted
+                and self._upload_pages
+                and self._design_fingerprint is not None
+                and await self.async_query_fingerprint() != self._design_fingerprint
+            ):
+                # The design uploaded to the flash is gone, so are the assets
+                _LOGGER.info("%s: filesystem erased, uploading all assets", name)
+                await self._assets.async_forget()
+                skip_unchanged = False
+
+            # Pages may reference assets, these go first
+            await self.async_sync_assets()
+            if self._pages_jsonl:
+                # A rebooted plate only keeps pages loaded from its flash
+                transferred = await self.async_send_pages(
+                    self._pages_jsonl, skip_unchanged=skip_unchanged
+                )
+                _LOGGER.debug(
+                    "%s: pages loaded in %.3fs", name, time.monotonic() - start
+                )
+
+        for obj in self._objects:
+            obj.hold_updates = True
+        try:
+            await asyncio.gather(load_pages(), enable_objects())
+        finally:
+            for obj in self._objects:
+                obj.hold_updates = False
+
+        if self._buffer.retain and not transferred:
+            # The broker restored the retained properties of the loaded design,
+            # publish the values rendered while updates were held back
+            await self.async_refresh_objects(self._objects, unsent_only=True)
+            await self.async_change_page(self._page)
+        else:
+            await self.refresh()
+        await self._buffer.async_flush()
+        _LOGGER.debug("%s: brought up in %.3fs", name, time.monotonic() - start)
+
+    async def async_sync_assets(self):
+        """Upload the configured assets that changed to the plate filesystem."""
+        if not self._assets.assets:
+            return
+
+        url = self._entry.data.get(DISCOVERED_URL)
+        if not url:
+            _LOGGER.warning(
+                "No URL known for %s, can't upload assets", self._entry.data[CONF_NAME]
+            )
+            return
+
+        await self._assets.async_sync(url)
+
     async def async_load_page(self, path):
         """Load pages file on the SwitchPlate, existing pages will not be cleared."""
-        cmd_topic = f"{self._topic}/command"
-        _LOGGER.info("Load page %s to %s", path, cmd_topic)
+        if await self.async_send_pages(path):
+            await self.refresh()
 
+    async def async_prepare_pages(self, path):
+        """Read and validate a pages file, return its JSONL lines."""
         if not self.hass.config.is_allowed_path(path):
             _LOGGER.error("'%s' is not an allowed directory", path)
-            return
-
-        async def send_lines(lines):
-            mqtt_payload_buffer = ""
-            for line in lines:
-                if len(mqtt_payload_buffer) + len(line) > 1000:
-                    await async_publish(
-                        self.hass,
-                        f"{cmd_topic}/jsonl",
-                        mqtt_payload_buffer,
-                        qos=0,
-                        retain=False,
-                    )
-                    mqtt_payload_buffer = line
-                else:
-                    mqtt_payload_buffer = mqtt_payload_buffer + line
-            await async_publish(
-                self.hass,
-                f"{cmd_topic}/jsonl",
-                mqtt_payload_buffer,
-                qos=0,
-                retain=False,
-            )
+            return None
 
         try:
             pages_file = await self.hass.async_add_executor_job(self._read_file, path)
@@ -693,10 +1232,9 @@ class SwitchPlate(RestoreEntity):
                 for item in json_data:
                     if isinstance(item, dict):
                         lines.append(json.dumps(item) + "\n")
-                await send_lines(lines)
-            else:
-                await send_lines(pages_file.splitlines(keepends=True))
-            await self.refresh()
+                return lines
+
+            return pages_file.splitlines(keepends=True)
 
         except (IndexError, FileNotFoundError, IsADirectoryError, UnboundLocalError):
             _LOGGER.error(
@@ -717,56 +1255,279 @@ class SwitchPlate(RestoreEntity):
                 e.message,
             )
 
+        return None
+
+    async def async_query_fingerprint(self):
+        """Return the fingerprint of the design the plate holds, if any."""
+        waiter = self.hass.loop.create_future()
+
+        @callback
+        def fingerprint_received(msg):
+            """Process the fingerprint object text."""
+            try:
+                message = json.loads(msg.payload)
+            except json.JSONDecodeError:
+                return
+            if isinstance(message, dict) and not waiter.done():
+                waiter.set_result(message.get(HASP_TEXT))
+
+        unsubscribe = await async_get_router(self.hass, self._topic).async_subscribe(
+            HASP_FINGERPRINT_OBJ, fingerprint_received
+        )
+        try:
+            await async_publish(
+                self.hass,
+                f"{self._topic}/command/{HASP_FINGERPRINT_OBJ}.{HASP_TEXT}",
+                "",
+                qos=0,
+                retain=False,
+            )
+            return await asyncio.wait_for(waiter, FINGERPRINT_TIMEOUT)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            unsubscribe()
+
+    async def async_upload_pages(self, lines):
+        """Upload pages to the plate and load them, return True on success."""
+        url = self._entry.data.get(DISCOVERED_URL)
+        if not url:
+            _LOGGER.warning(
+                "No URL known for %s, can't upload pages", self._entry.data[CONF_NAME]
+            )
+            return False
+
+        try:
+            await async_upload_file(
+                async_get_clientsession(self.hass),
+                url,
+                HASP_PAGES_FILE,
+                "".join(lines).encode("utf-8"),
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.warning(
+                "Upload of pages to %s failed, sending them over MQTT: %s",
+                self._entry.data[CONF_NAME],
+                err,
+            )
+            return False
+
+        _LOGGER.info("Uploaded pages to %s", self._entry.data[CONF_NAME])
+        await async_publish(
+            self.hass,
+            f"{self._topic}/command",
+            f"run L:{HASP_PAGES_FILE}",
+            qos=0,
+            retain=False,
+        )
+        return True
+
+    async def async_send_pages(self, path, skip_unchanged=False):
+        """Send pages file to the SwitchPlate, return True if it was sent.
+
+        With skip_unchanged, the transfer is skipped if the plate already holds
+        a design with the same fingerprint.
+        """
+        cmd_topic = f"{self._topic}/command"
+
+        lines = await self.async_prepare_pages(path)
+        if lines is None:
+            return False
+
+        fingerprint = pages_fingerprint(lines)
+        if skip_unchanged and await self.async_query_fingerprint() == fingerprint:
+            _LOGGER.info("Plate already holds %s, not sent", path)
+            self._design_fingerprint = fingerprint
+            return False
+
+        _LOGGER.info("Load page %s to %s", path, cmd_topic)
+
+        # Store the fingerprint on the plate in a hidden object
+        if lines and not lines[-1].endswith("\n"):
+            lines[-1] += "\n"
+        lines.append(fingerprint_line(fingerprint))
+
+        if self._upload_pages and await self.async_upload_pages(lines):
+            self._design_fingerprint = fingerprint
+            return True
+
+        mqtt_payload_buffer = ""
+        for line in lines:
+            if len(mqtt_payload_buffer) + len(line) > HASP_MAX_PAYLOAD:
+                await async_publish(
+                    self.hass,
+                    f"{cmd_topic}/jsonl",
+                    mqtt_payload_buffer,
+                    qos=0,
+                    retain=False,
+                )
+                mqtt_payload_buffer = line
+            else:
+                mqtt_payload_buffer = mqtt_payload_buffer + line
+        await async_publish(
+            self.hass,
+            f"{cmd_topic}/jsonl",
+            mqtt_payload_buffer,
+            qos=0,
+            retain=False,
+        )
+
+        self._design_fingerprint = fingerprint
+        return True
+
 
 # pylint: disable=R0902
 class HASPObject:
     """Representation of an HASP-LVGL object."""
 
-    def __init__(self, hass, plate_topic, config):
+    def __init__(self, hass, plate_topic, config, cache_updated=None):
         """Initialize an object."""
 
         self.hass = hass
+        self.config = config
+        self.signature = config_signature(config)
+        self._cache_updated = cache_updated
+        self.plate_topic = plate_topic
+        self._buffer = async_get_write_buffer(hass, plate_topic)
         self.obj_id = config[CONF_OBJID]
-        subtopic = config.get("subtopic")
-        if subtopic:
-            self.command_topic = f"{plate_topic}/command/{subtopic}/{self.obj_id}."
+        self.subtopic = config.get(CONF_SUBTOPIC)
+        if self.subtopic:
+            self.command_topic = (
+                f"{plate_topic}/command/{self.subtopic}/{self.obj_id}."
+            )
+            self.cache_key = f"{self.subtopic}/{self.obj_id}"
         else:
             self.command_topic = f"{plate_topic}/command/{self.obj_id}."
-        self.state_topic = f"{plate_topic}/state/{self.obj_id}"
+            self.cache_key = self.obj_id
         self.cached_properties = {}
 
         self.properties = config.get(CONF_PROPERTIES)
-        self.event_services = {
-            event: Script(hass, script, plate_topic, DOMAIN)
-            for (event, script) in config[CONF_EVENT].items()
-        }
+        self.track = config.get(CONF_TRACK)
+        self._static_properties = {}
+        self._time_properties = []
+        self._analyze_properties()
+        self.cached_properties.update(self._static_properties)
+        # Scripts are validated with the configuration, but only built on first use
+        self.event_services = config[CONF_EVENT]
+        self._scripts = {}
+        # openHASP event -> configured events it matches
+        self._event_index = {}
+        for hasp_event in HASP_EVENTS:
+            events = [event for event in self.event_services if event in hasp_event]
+            if events:
+                self._event_index[hasp_event] = events
         self._tracked_property_templates = []
         self._freeze_properties = []
         self._subscriptions = []
+        # Latest "changed" event received while its scripts are running
+        self._changed_pending = None
+        self._changed_running = False
+        self.hold_updates = False
+        self._enabled = False
+
+    @property
+    def produced_properties(self):
+        """Return the properties set by the configuration of the object."""
+        produced = set(self.properties)
+        if self.track:
+            produced.update((HASP_VAL, HASP_TEXT))
+        return produced
 
     async def enable_object(self):
         """Initialize object events and properties subscriptions."""
+        if self._enabled:
+            # Tracking is kept while the plate is offline
+            return
+        self._enabled = True
 
         if self.event_services:
             _LOGGER.debug("Setup event_services for '%s'", self.obj_id)
             self._subscriptions.append(await self.async_listen_hasp_events())
 
+        if self.track:
+            _LOGGER.debug("Track '%s' on '%s'", self.track, self.obj_id)
+            self._subscriptions.append(self.async_track_entity())
+
         for _property, template in self.properties.items():
+            if _property in self._static_properties:
+                await self.async_update_property(
+                    _property, self._static_properties[_property]
+                )
+                continue
+
+            if _property in self._time_properties:
+                try:
+                    await self.async_update_property(
+                        _property, template.async_render()
+                    )
+                except TemplateError as err:
+                    _LOGGER.error(
+                        "TemplateError('%s') while processing template '%s'",
+                        err,
+                        template,
+                    )
+                async_get_time_tick(self.hass).async_add(self, _property, template)
+                continue
+
             self._tracked_property_templates.append(
                 await self.async_set_property(_property, template)
             )
 
+    def _analyze_properties(self):
+        """Find the templates that don't need a template tracker.
+
+        Templates that don't depend on entities or time are rendered once,
+        templates that only depend on time are rendered by the shared time tick.
+        """
+        for _property, template in self.properties.items():
+            if template.hass is None:
+                template.hass = self.hass
+
+            try:
+                info = template.async_render_to_info()
+                result = info.result()
+            except TemplateError:
+                # Let the template tracker report the error
+                continue
+
+            if (
+                info.entities
+                or info.domains
+                or info.domains_lifecycle
+                or info.all_states
+                or info.all_states_lifecycle
+                or result is None
+            ):
+                continue
+
+            if info.has_time:
+                self._time_properties.append(_property)
+            else:
+                self._static_properties[_property] = result
+
+        _LOGGER.debug(
+            "%s has static properties %s and time properties %s",
+            self.obj_id,
+            list(self._static_properties),
+            self._time_properties,
+        )
+
     async def disable_object(self):
         """Remove subscriptions and event tracking."""
         _LOGGER.debug("Disabling HASPObject %s", self.obj_id)
+        self._enabled = False
         for subscription in self._subscriptions:
             subscription()
         self._subscriptions = []
+        self._changed_pending = None
 
         for tracked_template in self._tracked_property_templates:
             tracked_template.async_remove()
         self._tracked_property_templates = []
 
+        if self._time_properties:
+            async_get_time_tick(self.hass).async_remove(self)
+
     async def async_set_property(self, _property, template):
         """Set HASP Object property to template value."""
 
@@ -788,11 +1549,6 @@ class HASPObject:
                 )
                 return
 
-            self.cached_properties[_property] = result
-            if _property in self._freeze_properties:
-                # Skip update to plate to avoid feedback loops
-                return
-
             _LOGGER.debug(
                 "%s.%s - %s changed, updating with: %s",
                 self.obj_id,
@@ -801,7 +1557,7 @@ class HASPObject:
                 result,
             )
 
-            await async_publish(self.hass, self.command_topic + _property, result)
+            await self.async_update_property(_property, result)
 
         property_template = async_track_template_result(
             self.hass,
@@ -812,11 +1568,99 @@ class HASPObject:
 
         return property_template
 
-    async def refresh(self):
-        """Refresh based on cached values."""
-        for _property, result in self.cached_properties.items():
-            _LOGGER.debug("Refresh object %s.%s = %s", self.obj_id, _property, result)
-            await async_publish(self.hass, self.command_topic + _property, result)
+    @callback
+    def async_track_entity(self):
+        """Map the tracked entity state to properties, without rendering templates."""
+
+        async def _async_update_tracked_properties(state):
+            for _property, result in track_state_properties(state).items():
+                if _property in self.properties:
+                    # Explicit property templates take precedence
+                    continue
+                await self.async_update_property(_property, result)
+
+        @callback
+        def _async_state_changed(event):
+            self.hass.async_create_task(
+                _async_update_tracked_properties(event.data.get("new_state"))
+            )
+
+        self.hass.async_create_task(
+            _async_update_tracked_properties(self.hass.states.get(self.track))
+        )
+
+        return async_track_state_change_event(
+            self.hass, [self.track], _async_state_changed
+        )
+
+    @callback
+    def async_cache_property(self, _property, result):
+        """Cache a property value, return True if it should be sent to the plate."""
+        if self.cached_properties.get(_property) != result:
+            self.cached_properties[_property] = result
+            if self._cache_updated:
+                self._cache_updated()
+
+        if self.hold_updates:
+            # Plate is being brought up, values are sent by its refresh
+            return False
+
+        # Skip update to plate while pressed to avoid feedback loops
+        return _property not in self._freeze_properties
+
+    async def async_update_property(self, _property, result):
+        """Cache a property value and send it to the plate."""
+        if not self.async_cache_property(_property, result):
+            return
+
+        await self._buffer.async_publish_properties([(self, _property, result)])
+
+    async def async_dispatch_event(self, message):
+        """Run the event scripts.
+
+        "changed" events run one at a time, those received meanwhile are
+        collapsed to the latest so that slow targets follow a slider without
+        lag building up. Other events run right away.
+        """
+        if message[HASP_EVENT] != HASP_EVENT_CHANGED:
+            await self.async_run_event_scripts(message)
+            return
+
+        if self._changed_running:
+            self._changed_pending = message
+            return
+
+        self._changed_running = True
+        try:
+            while message is not None:
+                await self.async_run_event_scripts(message)
+                message, self._changed_pending = self._changed_pending, None
+        finally:
+            self._changed_running = False
+
+    async def async_run_event_scripts(self, message):
+        """Run the scripts of the event in message."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Service call for '%s' triggered on '%s' with variables %s",
+                message[HASP_EVENT],
+                self.obj_id,
+                message,
+            )
+
+        context = Context()
+        for event in self._event_index[message[HASP_EVENT]]:
+            await self._get_script(event).async_run(
+                run_variables=message, context=context
+            )
+
+    def _get_script(self, event):
+        """Return the script of an event, building it on first use."""
+        if event not in self._scripts:
+            self._scripts[event] = Script(
+                self.hass, self.event_services[event], self.plate_topic, DOMAIN
+            )
+        return self._scripts[event]
 
     async def async_listen_hasp_events(self):
         """Listen to messages on MQTT for HASP events."""
@@ -825,7 +1669,7 @@ class HASPObject:
         async def message_received(msg):
             """Process object state MQTT message."""
             try:
-                message = HASP_EVENT_SCHEMA(json.loads(msg.payload))
+                message = decode_event(msg.payload)
 
                 if message[HASP_EVENT] == HASP_EVENT_DOWN:
                     # store properties that shouldn't be updated while button pressed
@@ -833,19 +1677,8 @@ class HASPObject:
                 elif message[HASP_EVENT] in [HASP_EVENT_UP, HASP_EVENT_RELEASE]:
                     self._freeze_properties = []
 
-                for event, script in self.event_services.items():
-                    if event in message[HASP_EVENT]:
-                        _LOGGER.debug(
-                            "Service call for '%s' triggered by '%s' on '%s' with variables %s",
-                            event,
-                            msg.payload,
-                            msg.topic,
-                            message,
-                        )
-                        await script.async_run(
-                            run_variables=message,
-                            context=Context(),
-                        )
+                if message[HASP_EVENT] in self._event_index:
+                    await self.async_dispatch_event(message)
             except vol.error.Invalid:
                 _LOGGER.debug(
                     "Could not handle openHASP event: '%s' on '%s'",
@@ -857,5 +1690,7 @@ class HASPObject:
                     "Error decoding received JSON message: %s on %s", err.doc, msg.topic
                 )
 
-        _LOGGER.debug("Subscribe to '%s' events on '%s'", self.obj_id, self.state_topic)
-        return await async_subscribe(self.hass, self.state_topic, message_received)
+        _LOGGER.debug("Subscribe to '%s' events on '%s'", self.obj_id, self.plate_topic)
+        return await async_get_router(self.hass, self.plate_topic).async_subscribe(
+            self.obj_id, message_received
+        )
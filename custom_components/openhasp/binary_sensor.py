@@ -1,9 +1,8 @@
 """Allows to configure a binary sensor using GPIO."""
-import json
 import logging
 from typing import Callable
 
-from homeassistant.components.mqtt import async_publish, async_subscribe
+from homeassistant.components.mqtt import async_publish
 from homeassistant.components.binary_sensor import BinarySensorEntity
 
 # pylint: disable=R0801
@@ -13,8 +12,9 @@ from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 
-from .common import HASPEntity
+from .common import HASPEntity, async_get_router
 from .const import CONF_HWID, CONF_INPUT, CONF_TOPIC
+from .decode import decode_state
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -88,7 +88,7 @@ class HASPBinarySensor(HASPEntity, BinarySensorEntity):
 
             try:
                 self._available = True
-                message = HASP_BINARY_INPUT_SCHEMA(json.loads(msg.payload))
+                message = decode_state(msg.payload)
                 _LOGGER.debug("%s state = %s", self.name, message)
 
                 self._state = message["state"]
@@ -98,10 +98,8 @@ class HASPBinarySensor(HASPEntity, BinarySensorEntity):
                 _LOGGER.error(err)
 
         self._subscriptions.append(
-            await async_subscribe(
-                self.hass,
-                f"{self._topic}/state/input{self._gpio}",
-                state_message_received,
+            await async_get_router(self.hass, self._topic).async_subscribe(
+                f"input{self._gpio}", state_message_received
             )
         )
 
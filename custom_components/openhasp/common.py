@@ -1,23 +1,312 @@
 """HASP-LVGL Commonalities."""
+import asyncio
+import json
 import logging
 
+from homeassistant.components.mqtt import async_publish, async_subscribe
 from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import Entity, ToggleEntity
 import voluptuous as vol
 
 from .const import (
-    CONF_PLATE,
+    DATA_CHANNELS,
+    DATA_ROUTERS,
+    DATA_WRITE_BUFFERS,
     DOMAIN,
-    EVENT_HASP_PLATE_OFFLINE,
-    EVENT_HASP_PLATE_ONLINE,
     HASP_IDLE_STATES,
+    HASP_MAX_PAYLOAD,
+    SIGNAL_PLATE_OFFLINE,
+    SIGNAL_PLATE_ONLINE,
 )
+from .decode import decode_idle, decode_lwt, decode_page, decode_statusupdate
 
 _LOGGER = logging.getLogger(__name__)
 
 
 HASP_IDLE_SCHEMA = vol.Schema(vol.Any(*HASP_IDLE_STATES))
 
+# Plate level topics and their decoders, LWT is outside of the state topics
+PLATE_LWT = "LWT"
+PLATE_DECODERS = {
+    "idle": decode_idle,
+    "page": decode_page,
+    "statusupdate": decode_statusupdate,
+    PLATE_LWT: decode_lwt,
+}
+
+
+async def async_publish_commands(hass, topic, commands):
+    """Send a list of commands to a plate using as few messages as possible.
+
+    Commands are sent in order as JSON arrays to the plate command/json topic,
+    split only when the payload would exceed the plate buffer.
+    """
+    batch = []
+    size = 1  # brackets of the JSON array, less the first separator
+    for command in commands:
+        command_size = len(json.dumps(command)) + 1  # with its separator
+        if batch and size + command_size > HASP_MAX_PAYLOAD:
+            await async_publish(
+                hass,
+                f"{topic}/command/json",
+                json.dumps(batch, separators=(",", ":")),
+                qos=0,
+                retain=False,
+            )
+            batch = []
+            size = 1
+        batch.append(command)
+        size += command_size
+
+    if batch:
+        await async_publish(
+            hass,
+            f"{topic}/command/json",
+            json.dumps(batch, separators=(",", ":")),
+            qos=0,
+            retain=False,
+        )
+
+
+@callback
+def async_get_router(hass, topic):
+    """Return the state router of the plate with the given base topic."""
+    routers = hass.data[DOMAIN].setdefault(DATA_ROUTERS, {})
+    if topic not in routers:
+        routers[topic] = HASPStateRouter(hass, topic)
+    return routers[topic]
+
+
+class HASPStateRouter:
+    """Single wildcard subscription to the state topics of a plate."""
+
+    def __init__(self, hass, topic):
+        """Initialize the router."""
+        self.hass = hass
+        self._prefix = f"{topic}/state/"
+        self._routes = {}
+        self._lock = asyncio.Lock()
+        self._unsub = None
+
+    async def async_subscribe(self, subtopic, msg_callback):
+        """Route messages of {topic}/state/{subtopic} to msg_callback."""
+        self._routes.setdefault(subtopic, []).append(msg_callback)
+
+        async with self._lock:
+            if self._unsub is None:
+                _LOGGER.debug("Subscribe to %s#", self._prefix)
+                self._unsub = await async_subscribe(
+                    self.hass, f"{self._prefix}#", self._async_message_received
+                )
+
+        @callback
+        def async_remove():
+            """Remove the route."""
+            self._routes[subtopic].remove(msg_callback)
+            if not self._routes[subtopic]:
+                del self._routes[subtopic]
+
+            if not self._routes and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return async_remove
+
+    @callback
+    def _async_message_received(self, msg):
+        """Dispatch a message to the callbacks of its subtopic."""
+        for msg_callback in list(self._routes.get(msg.topic[len(self._prefix) :], ())):
+            result = msg_callback(msg)
+            if asyncio.iscoroutine(result):
+                self.hass.async_create_task(result)
+
+
+@callback
+def async_get_channel(hass, topic):
+    """Return the channel of plate level messages of the given base topic."""
+    channels = hass.data[DOMAIN].setdefault(DATA_CHANNELS, {})
+    if topic not in channels:
+        channels[topic] = HASPPlateChannel(hass, topic)
+    return channels[topic]
+
+
+class HASPPlateChannel:
+    """Plate level messages, decoded once and fanned out to all listeners.
+
+    Listeners get the decoded message and must not modify it.
+    """
+
+    def __init__(self, hass, topic):
+        """Initialize the channel."""
+        self.hass = hass
+        self._topic = topic
+        self._listeners = {}
+        self._unsubs = {}
+        self._lock = asyncio.Lock()
+
+    async def async_listen(self, subtopic, listener):
+        """Call listener with the decoded messages of a plate level topic."""
+        self._listeners.setdefault(subtopic, []).append(listener)
+
+        async with self._lock:
+            if subtopic not in self._unsubs:
+
+                @callback
+                def message_received(msg):
+                    """Decode and fan out a message."""
+                    self._async_message_received(subtopic, msg)
+
+                if subtopic == PLATE_LWT:
+                    self._unsubs[subtopic] = await async_subscribe(
+                        self.hass, f"{self._topic}/{PLATE_LWT}", message_received
+                    )
+                else:
+                    self._unsubs[subtopic] = await async_get_router(
+                        self.hass, self._topic
+                    ).async_subscribe(subtopic, message_received)
+
+        @callback
+        def async_remove():
+            """Remove the listener."""
+            self._listeners[subtopic].remove(listener)
+            if not self._listeners[subtopic]:
+                del self._listeners[subtopic]
+                if subtopic in self._unsubs:
+                    self._unsubs.pop(subtopic)()
+
+        return async_remove
+
+    @callback
+    def _async_message_received(self, subtopic, msg):
+        """Decode a message once and pass it to the listeners."""
+        try:
+            message = PLATE_DECODERS[subtopic](msg.payload)
+        except vol.Invalid as err:
+            _LOGGER.error("While processing %s of %s: %s", subtopic, self._topic, err)
+            return
+
+        for listener in list(self._listeners.get(subtopic, ())):
+            result = listener(message)
+            if asyncio.iscoroutine(result):
+                self.hass.async_create_task(result)
+
+
+@callback
+def async_get_write_buffer(hass, topic):
+    """Return the write buffer of the plate with the given base topic."""
+    buffers = hass.data[DOMAIN].setdefault(DATA_WRITE_BUFFERS, {})
+    if topic not in buffers:
+        buffers[topic] = HASPWriteBuffer(hass, topic)
+    return buffers[topic]
+
+
+class HASPWriteBuffer:
+    """Write-behind buffer of the values sent to a plate.
+
+    While the plate is offline only the latest value of each object property
+    or entity is kept. When it comes back, the values that differ from what
+    was last sent to the plate are flushed.
+
+    With retain, object properties are published retained on their own command
+    topic instead, the broker then restores them when the plate reconnects.
+    """
+
+    def __init__(self, hass, topic):
+        """Initialize the buffer."""
+        self.hass = hass
+        self.online = False
+        self.retain = False
+        self._topic = topic
+        self._sent = {}
+        self._pending = {}
+
+    async def async_publish(self, topic, payload, key=None):
+        """Publish a value to the plate, buffer it while the plate is offline."""
+        await self._async_send({key or topic: (topic, payload, None, False)})
+
+    async def async_publish_properties(self, updates, unsent_only=False):
+        """Publish (object, property, value) updates, batched when possible.
+
+        With unsent_only, values already sent are skipped.
+        """
+        entries = {
+            obj.command_topic
+            + _property: (
+                obj.command_topic + _property,
+                result,
+                None
+                if obj.subtopic or self.retain
+                else f"{obj.obj_id}.{_property}={result}",
+                self.retain,
+            )
+            for obj, _property, result in updates
+        }
+        if unsent_only:
+            entries = {
+                key: entry
+                for key, entry in entries.items()
+                if key not in self._sent or self._sent[key] != entry[1]
+            }
+        await self._async_send(entries)
+
+    async def async_clear_properties(self, obj):
+        """Clear the retained property values of an object."""
+        await self.async_clear_topics(
+            obj.command_topic + _property
+            for _property in set(obj.properties) | set(obj.cached_properties)
+        )
+
+    async def async_clear_topics(self, topics):
+        """Clear the retained values of property command topics."""
+        for topic in topics:
+            self._sent.pop(topic, None)
+            self._pending.pop(topic, None)
+            await async_publish(self.hass, topic, "", qos=0, retain=True)
+
+    async def _async_send(self, entries):
+        """Send entries to the plate, or keep the latest ones while offline."""
+        if not self.online:
+            # The broker keeps retained values for the plate
+            retained = {key: entry for key, entry in entries.items() if entry[3]}
+            self._pending.update(
+                {key: entry for key, entry in entries.items() if not entry[3]}
+            )
+            if not retained:
+                return
+            entries = retained
+
+        commands = []
+        for key, (topic, payload, command, retain) in entries.items():
+            self._sent[key] = payload
+            if command is None or len(entries) == 1:
+                await async_publish(self.hass, topic, payload, qos=0, retain=retain)
+            else:
+                commands.append(command)
+
+        await async_publish_commands(self.hass, self._topic, commands)
+
+    async def async_flush(self):
+        """Send the values buffered while offline that the plate doesn't have."""
+        pending, self._pending = self._pending, {}
+        entries = {
+            key: entry
+            for key, entry in pending.items()
+            if key not in self._sent or self._sent[key] != entry[1]
+        }
+        _LOGGER.debug(
+            "Flush %s: %s of %s buffered values",
+            self._topic,
+            len(entries),
+            len(pending),
+        )
+        await self._async_send(entries)
+
+    @callback
+    def async_reset(self):
+        """Forget what was sent, the plate lost its state."""
+        self._sent.clear()
+
 
 class HASPEntity(Entity):
     """Generic HASP entity (base class)."""
@@ -46,36 +335,44 @@ class HASPEntity(Entity):
         """Sync local state back to plate."""
         raise NotImplementedError()
 
+    async def async_publish_state(self, topic, payload):
+        """Send the entity state to the plate, buffered while it is offline."""
+        await async_get_write_buffer(self.hass, self._topic).async_publish(
+            topic, payload, key=self.unique_id
+        )
+
     async def async_added_to_hass(self):
         """Run when entity about to be added."""
         await super().async_added_to_hass()
 
         @callback
-        async def online(event):
-            if event.data[CONF_PLATE] == self._hwid:
-                self._available = True
-                if self._state:
-                    await self.refresh()
-                else:
-                    self.async_write_ha_state()  # Just to update availability
-                _LOGGER.debug(
-                    "%s is available, %s",
-                    self.entity_id,
-                    "refresh" if self._state else "stale",
-                )
+        async def online():
+            self._available = True
+            if self._state:
+                await self.refresh()
+            else:
+                self.async_write_ha_state()  # Just to update availability
+            _LOGGER.debug(
+                "%s is available, %s",
+                self.entity_id,
+                "refresh" if self._state else "stale",
+            )
 
         self._subscriptions.append(
-            self.hass.bus.async_listen(EVENT_HASP_PLATE_ONLINE, online)
+            async_dispatcher_connect(
+                self.hass, SIGNAL_PLATE_ONLINE.format(self._hwid), online
+            )
         )
 
         @callback
-        async def offline(event):
-            if event.data[CONF_PLATE] == self._hwid:
-                self._available = False
-                self.async_write_ha_state()
+        def offline():
+            self._available = False
+            self.async_write_ha_state()
 
         self._subscriptions.append(
-            self.hass.bus.async_listen(EVENT_HASP_PLATE_OFFLINE, offline)
+            async_dispatcher_connect(
+                self.hass, SIGNAL_PLATE_OFFLINE.format(self._hwid), offline
+            )
         )
 
     async def async_will_remove_from_hass(self):
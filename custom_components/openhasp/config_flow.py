@@ -21,7 +21,10 @@ from .const import (
     CONF_PAGES,
     CONF_PAGES_PATH,
     CONF_RELAYS,
+    CONF_RETAIN_STATE,
+    CONF_SLIM_ATTRIBUTES,
     CONF_TOPIC,
+    CONF_UPLOAD_PAGES,
     DEFAULT_IDLE_BRIGHNESS,
     DEFAULT_TOPIC,
     DISCOVERED_DIM,
@@ -259,6 +262,20 @@ class OpenHASPOptionsFlowHandler(config_entries.OptionsFlow):
                             self.config_entry.data.get(CONF_PAGES_PATH, ""),
                         ),
                     ): cv.string,
+                    vol.Optional(
+                        CONF_UPLOAD_PAGES,
+                        default=self.config_entry.options.get(CONF_UPLOAD_PAGES, False),
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_RETAIN_STATE,
+                        default=self.config_entry.options.get(CONF_RETAIN_STATE, False),
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_SLIM_ATTRIBUTES,
+                        default=self.config_entry.options.get(
+                            CONF_SLIM_ATTRIBUTES, False
+                        ),
+                    ): cv.boolean,
                 }
             ),
         )
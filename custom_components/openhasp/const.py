@@ -7,6 +7,7 @@ MINOR = "7"
 DOMAIN = "openhasp"
 
 CONF_COMPONENT = "component"
+CONF_ASSETS = "assets"
 CONF_OBJID = "obj"
 CONF_PROPERTIES = "properties"
 CONF_EVENT = "event"
@@ -19,6 +20,9 @@ CONF_VAL = "val"
 CONF_IDLE_BRIGHTNESS = "idle_brightness"
 CONF_AWAKE_BRIGHTNESS = "awake_brightness"
 CONF_PLATE = "plate"
+CONF_PLATES = "plates"
+CONF_GROUPS = "groups"
+CONF_GROUP_TOPIC = "group_topic"
 CONF_RELAYS = "relay"
 CONF_LIGHTS = "light"
 CONF_DIMLIGHTS = "dimlight"
@@ -29,15 +33,34 @@ CONF_NODE = "node"
 CONF_HWID = "hwid"
 CONF_INPUT = "input"
 CONF_SUBTOPIC = "subtopic"
+CONF_UPLOAD_PAGES = "upload_pages"
+CONF_RETAIN_STATE = "retain_state"
+CONF_SLIM_ATTRIBUTES = "slim_attributes"
 
 
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
 DATA_LISTENER = "listener"
 DATA_IMAGES = "images"
+DATA_TIME_TICK = "time_tick"
+DATA_ROUTERS = "routers"
+DATA_YAML_CONFIG = "yaml_config"
+DATA_WRITE_BUFFERS = "write_buffers"
+DATA_CHANNELS = "channels"
+DATA_GROUPS = "groups"
 
 DEFAULT_TOPIC = "hasp"
 DEFAULT_PATH = "pages.jsonl"
 DEFAULT_IDLE_BRIGHNESS = 25
 
+ENABLE_OBJECTS_CONCURRENCY = 10
+STATUSUPDATE_TIMEOUT = 5
+FINGERPRINT_TIMEOUT = 2
+UPLOAD_TIMEOUT = 30
+UPTIME_TOLERANCE = 10
+STATE_WRITE_DELAY = 0.5
+
 DISCOVERED_NODE = "node"
 DISCOVERED_NODE_T = "node_t"
 DISCOVERED_MODEL = "mdl"
@@ -53,7 +76,10 @@ DISCOVERED_INPUT = "input"
 DISCOVERED_URL = "uri"
 
 HASP_NUM_PAGES = "numPages"
+# Statusupdate fields kept as plate attributes with slim attributes
+HASP_SLIM_ATTRIBUTES = ("idle", "version", "ip", HASP_NUM_PAGES)
 HASP_VAL = "val"
+HASP_TEXT = "text"
 HASP_EVENT = "event"
 HASP_EVENT_ON = "on"
 HASP_EVENT_OFF = "off"
@@ -82,6 +108,9 @@ HASP_IDLE_STATES = (HASP_IDLE_OFF, HASP_IDLE_SHORT, HASP_IDLE_LONG)
 HASP_ONLINE = "online"
 HASP_OFFLINE = "offline"
 HASP_LWT = (HASP_ONLINE, HASP_OFFLINE)
+HASP_MAX_PAYLOAD = 1000  # Plate MQTT buffer is 1024 bytes, keep some margin
+HASP_FINGERPRINT_OBJ = "p0b254"  # Hidden label holding the design fingerprint
+HASP_PAGES_FILE = "/pages.jsonl"
 
 ATTR_FORCE_FITSCREEN = "fit_screen"
 ATTR_PAGE = "page"
@@ -109,6 +138,15 @@ SERVICE_PAGE_PREV = "prev_page"
 SERVICE_COMMAND = "command"
 SERVICE_CONFIG = "config"
 SERVICE_PUSH_IMAGE = "push_image"
+SERVICE_RELOAD = "reload"
+SERVICE_GROUP_CLEAR_PAGE = "group_clear_page"
+SERVICE_GROUP_PAGE_CHANGE = "group_change_page"
+SERVICE_GROUP_COMMAND = "group_command"
+SERVICE_GROUP_CONFIG = "group_config"
 
 EVENT_HASP_PLATE_ONLINE = "openhasp_plate_online"
 EVENT_HASP_PLATE_OFFLINE = "openhasp_plate_offline"
+
+SIGNAL_PLATE_ONLINE = "openhasp_plate_online_{}"
+SIGNAL_PLATE_OFFLINE = "openhasp_plate_offline_{}"
+SIGNAL_PLATES_CHANGED = "openhasp_plates_changed"
@@ -0,0 +1,149 @@
+"""Fast decoding of the messages published by openHASP plates.
+
+The plates publish small payloads with a fixed shape, at high rates for
+sliders and encoders. These validators are the hand-compiled equivalents of
+the voluptuous schemas and raise the same vol.Invalid errors.
+"""
+from numbers import Number
+
+import voluptuous as vol
+
+from .const import HASP_EVENT, HASP_EVENTS, HASP_IDLE_STATES, HASP_LWT
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads
+
+BOOLEAN_TRUE = frozenset(("1", "true", "yes", "on", "enable"))
+BOOLEAN_FALSE = frozenset(("0", "false", "no", "off", "disable"))
+
+LIGHT_KEYS = frozenset(("state", "brightness"))
+BACKLIGHT_KEYS = LIGHT_KEYS
+MOODLIGHT_KEYS = frozenset(("state", "r", "g", "b", "brightness", "color"))
+MOODLIGHT_REQUIRED_KEYS = ("r", "g", "b", "brightness")
+STATE_KEYS = frozenset(("state",))
+
+
+def boolean(value):
+    """Validate and coerce a boolean value, like cv.boolean."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        value = value.lower().strip()
+        if value in BOOLEAN_TRUE:
+            return True
+        if value in BOOLEAN_FALSE:
+            return False
+    elif isinstance(value, Number):
+        return value != 0
+    raise vol.Invalid(f"invalid boolean value {value}")
+
+
+def _object(payload, keys=None):
+    """Decode a JSON object, optionally restricted to the given keys."""
+    message = json_loads(payload)
+    if not isinstance(message, dict):
+        raise vol.Invalid(f"expected a JSON object, got {payload}")
+    if keys is not None and not keys.issuperset(message):
+        raise vol.Invalid(f"extra keys not allowed in {payload}")
+    return message
+
+
+def _byte(message, key):
+    """Validate a required 0..255 integer."""
+    try:
+        value = message[key]
+    except KeyError as err:
+        raise vol.Invalid(f"required key not provided @ data['{key}']") from err
+    if not isinstance(value, int) or not 0 <= value <= 255:
+        raise vol.Invalid(f"value must be an integer between 0 and 255 for '{key}'")
+    return value
+
+
+def _state(message):
+    """Validate the required state of an output."""
+    try:
+        message["state"] = boolean(message["state"])
+    except KeyError as err:
+        raise vol.Invalid("required key not provided @ data['state']") from err
+    return message
+
+
+def decode_event(payload):
+    """Decode an object event, like HASP_EVENT_SCHEMA."""
+    message = _object(payload)
+    if message.get(HASP_EVENT) not in HASP_EVENTS:
+        raise vol.Invalid(f"not a valid event in {payload}")
+    return message
+
+
+def decode_idle(payload):
+    """Decode the idle state, like HASP_IDLE_SCHEMA."""
+    if payload not in HASP_IDLE_STATES:
+        raise vol.Invalid(f"not a valid idle state {payload}")
+    return payload
+
+
+def decode_lwt(payload):
+    """Decode the plate availability, like HASP_LWT_SCHEMA."""
+    if payload not in HASP_LWT:
+        raise vol.Invalid(f"not a valid LWT {payload}")
+    return payload
+
+
+def decode_page(payload):
+    """Decode the current page, like HASP_PAGE_SCHEMA."""
+    try:
+        page = int(payload)
+    except (TypeError, ValueError) as err:
+        raise vol.Invalid(f"expected int for page, got {payload}") from err
+    if not 0 <= page <= 12:
+        raise vol.Invalid(f"page {page} out of range")
+    return page
+
+
+def decode_statusupdate(payload):
+    """Decode a statusupdate, like HASP_STATUSUPDATE_SCHEMA."""
+    message = _object(payload)
+    try:
+        for key in ("node", "version"):
+            if isinstance(message[key], (list, dict)) or message[key] is None:
+                raise vol.Invalid(f"expected str for '{key}'")
+            message[key] = str(message[key])
+        if not isinstance(message["uptime"], int):
+            raise vol.Invalid("expected int for 'uptime'")
+        message["canUpdate"] = boolean(message["canUpdate"])
+    except KeyError as err:
+        raise vol.Invalid(f"required key not provided @ data[{err}]") from err
+    return message
+
+
+def decode_state(payload):
+    """Decode a relay or input state, like HASP_RELAY_SCHEMA."""
+    return _state(_object(payload, STATE_KEYS))
+
+
+def decode_light(payload):
+    """Decode a light state, like HASP_LIGHT_SCHEMA."""
+    message = _state(_object(payload, LIGHT_KEYS))
+    if "brightness" in message:
+        _byte(message, "brightness")
+    return message
+
+
+def decode_backlight(payload):
+    """Decode the backlight state, like HASP_BACKLIGHT_SCHEMA."""
+    message = _state(_object(payload, BACKLIGHT_KEYS))
+    _byte(message, "brightness")
+    return message
+
+
+def decode_moodlight(payload):
+    """Decode the moodlight state, like HASP_MOODLIGHT_SCHEMA."""
+    message = _state(_object(payload, MOODLIGHT_KEYS))
+    for key in MOODLIGHT_REQUIRED_KEYS:
+        _byte(message, key)
+    if "color" in message and not isinstance(message["color"], str):
+        raise vol.Invalid("expected str for 'color'")
+    return message
@@ -0,0 +1,21 @@
+"""Diagnostics support for openHASP."""
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_NAME
+
+from .const import CONF_HWID, CONF_PLATE, DOMAIN
+
+TO_REDACT = {CONF_HWID, "mac", "ssid"}
+
+
+async def async_get_config_entry_diagnostics(hass, entry):
+    """Return diagnostics of a plate, with its full statusupdate."""
+    plate = hass.data[DOMAIN][CONF_PLATE].get(entry.data[CONF_NAME])
+
+    return {
+        "entry": async_redact_data(
+            {"data": dict(entry.data), "options": dict(entry.options)}, TO_REDACT
+        ),
+        "statusupdate": async_redact_data(plate.statusupdate, TO_REDACT)
+        if plate is not None
+        else None,
+    }
@@ -9,7 +9,7 @@ from homeassistant.components.light import (
     ColorMode,
     LightEntity,
 )
-from homeassistant.components.mqtt import async_publish, async_subscribe
+from homeassistant.components.mqtt import async_publish
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant, callback
@@ -18,7 +18,7 @@ from homeassistant.helpers.restore_state import RestoreEntity
 import homeassistant.util.color as color_util
 import voluptuous as vol
 
-from .common import HASP_IDLE_SCHEMA, HASPToggleEntity
+from .common import HASPToggleEntity, async_get_channel, async_get_router
 from .const import (
     ATTR_AWAKE_BRIGHTNESS,
     ATTR_IDLE_BRIGHTNESS,
@@ -31,6 +31,7 @@ from .const import (
     HASP_IDLE_OFF,
     HASP_IDLE_SHORT,
 )
+from .decode import decode_backlight, decode_light, decode_moodlight
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -116,12 +117,9 @@ class HASPLight(HASPToggleEntity, LightEntity):
 
     async def refresh(self):
         """Sync local state back to plate."""
-        await async_publish(
-            self.hass,
+        await self.async_publish_state(
             f"{self._topic}/command/output{self._gpio}",
             json.dumps(HASP_LIGHT_SCHEMA({"state": int(self._state)})),
-            qos=0,
-            retain=False,
         )
         self.async_write_ha_state()
 
@@ -135,7 +133,7 @@ class HASPLight(HASPToggleEntity, LightEntity):
 
             try:
                 self._available = True
-                message = HASP_LIGHT_SCHEMA(json.loads(msg.payload))
+                message = decode_light(msg.payload)
                 _LOGGER.debug("received light %s:  %s", self.name, message)
 
                 self._state = message["state"]
@@ -145,10 +143,8 @@ class HASPLight(HASPToggleEntity, LightEntity):
                 _LOGGER.error(err)
 
         self._subscriptions.append(
-            await async_subscribe(
-                self.hass,
-                f"{self._topic}/state/output{self._gpio}",
-                light_state_message_received,
+            await async_get_router(self.hass, self._topic).async_subscribe(
+                f"output{self._gpio}", light_state_message_received
             )
         )
 
@@ -189,16 +185,13 @@ class HASPDimmableLight(HASPToggleEntity, LightEntity):
             self._brightness,
         )
 
-        await async_publish(
-            self.hass,
+        await self.async_publish_state(
             f"{self._topic}/command/output{self._gpio}",
             json.dumps(
                 HASP_LIGHT_SCHEMA(
                     {"state": self._state, "brightness": self._brightness}
                 )
             ),
-            qos=0,
-            retain=False,
         )
         self.async_write_ha_state()
 
@@ -212,7 +205,7 @@ class HASPDimmableLight(HASPToggleEntity, LightEntity):
 
             try:
                 self._available = True
-                message = HASP_LIGHT_SCHEMA(json.loads(msg.payload))
+                message = decode_light(msg.payload)
                 _LOGGER.debug("received dimmable light %s:  %s", self.name, message)
 
                 self._state = message["state"]
@@ -223,10 +216,8 @@ class HASPDimmableLight(HASPToggleEntity, LightEntity):
                 _LOGGER.error(err)
 
         self._subscriptions.append(
-            await async_subscribe(
-                self.hass,
-                f"{self._topic}/state/output{self._gpio}",
-                dimmable_light_message_received,
+            await async_get_router(self.hass, self._topic).async_subscribe(
+                f"output{self._gpio}", dimmable_light_message_received
             )
         )
 
@@ -297,7 +288,6 @@ class HASPBackLight(HASPToggleEntity, LightEntity, RestoreEntity):
         await self.async_listen_idleness()
 
         cmd_topic = f"{self._topic}/command"
-        state_topic = f"{self._topic}/state/backlight"
 
         @callback
         async def backlight_message_received(msg):
@@ -305,7 +295,7 @@ class HASPBackLight(HASPToggleEntity, LightEntity, RestoreEntity):
 
             try:
                 self._available = True
-                message = HASP_BACKLIGHT_SCHEMA(json.loads(msg.payload))
+                message = decode_backlight(msg.payload)
                 _LOGGER.debug("received backlight %s: %s", self.name, message)
 
                 self._state = message["state"]
@@ -321,7 +311,9 @@ class HASPBackLight(HASPToggleEntity, LightEntity, RestoreEntity):
                 )
 
         self._subscriptions.append(
-            await async_subscribe(self.hass, state_topic, backlight_message_received)
+            await async_get_router(self.hass, self._topic).async_subscribe(
+                "backlight", backlight_message_received
+            )
         )
 
         await async_publish(self.hass, cmd_topic, "backlight", qos=0, retain=False)
@@ -329,11 +321,8 @@ class HASPBackLight(HASPToggleEntity, LightEntity, RestoreEntity):
     async def async_listen_idleness(self):
         """Listen to messages on MQTT for HASP idleness."""
 
-        @callback
-        async def idle_message_received(msg):
-            """Process MQTT message from plate."""
-            message = HASP_IDLE_SCHEMA(msg.payload)
-
+        async def idle_message_received(message):
+            """Process idle state of the plate."""
             if message == HASP_IDLE_OFF:
                 brightness = self._awake_brightness
                 backlight = "on"
@@ -363,11 +352,10 @@ class HASPBackLight(HASPToggleEntity, LightEntity, RestoreEntity):
                 qos=0,
                 retain=False,
             )
-            self.async_write_ha_state()
 
         self._subscriptions.append(
-            await async_subscribe(
-                self.hass, f"{self._topic}/state/idle", idle_message_received
+            await async_get_channel(self.hass, self._topic).async_listen(
+                "idle", idle_message_received
             )
         )
 
@@ -382,12 +370,8 @@ class HASPBackLight(HASPToggleEntity, LightEntity, RestoreEntity):
 
         _LOGGER.debug("refresh(%s) backlight - %s", self.name, new_state)
 
-        await async_publish(
-            self.hass,
-            cmd_topic,
-            f"backlight {json.dumps(new_state)}",
-            qos=0,
-            retain=False,
+        await self.async_publish_state(
+            cmd_topic, f"backlight {json.dumps(new_state)}"
         )
         self.async_write_ha_state()
 
@@ -447,7 +431,7 @@ class HASPMoodLight(HASPToggleEntity, LightEntity, RestoreEntity):
 
             try:
                 self._available = True
-                message = HASP_MOODLIGHT_SCHEMA(json.loads(msg.payload))
+                message = decode_moodlight(msg.payload)
                 _LOGGER.debug("received moodlight %s: %s", self.name, message)
 
                 self._state = message["state"]
@@ -461,8 +445,8 @@ class HASPMoodLight(HASPToggleEntity, LightEntity, RestoreEntity):
                 _LOGGER.error("While proccessing moodlight: %s", err)
 
         self._subscriptions.append(
-            await async_subscribe(
-                self.hass, f"{self._topic}/state/moodlight", moodlight_message_received
+            await async_get_router(self.hass, self._topic).async_subscribe(
+                "moodlight", moodlight_message_received
             )
         )
 
@@ -482,12 +466,8 @@ class HASPMoodLight(HASPToggleEntity, LightEntity, RestoreEntity):
             new_state["brightness"] = self._brightness
 
         _LOGGER.debug("refresh(%s) moodlight - %s", self.name, new_state)
-        await async_publish(
-            self.hass,
-            cmd_topic,
-            f"moodlight {json.dumps(new_state)}",
-            qos=0,
-            retain=False,
+        await self.async_publish_state(
+            cmd_topic, f"moodlight {json.dumps(new_state)}"
         )
 
     async def async_turn_on(self, **kwargs):
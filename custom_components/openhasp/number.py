@@ -2,7 +2,6 @@
 from dataclasses import dataclass
 import logging
 
-from homeassistant.components.mqtt import async_publish, async_subscribe
 from homeassistant.components.number import NumberEntity, NumberEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
@@ -10,7 +9,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .common import HASPEntity
+from .common import HASPEntity, async_get_channel
 from .const import CONF_HWID, CONF_TOPIC
 
 _LOGGER = logging.getLogger(__name__)
@@ -21,7 +20,7 @@ class HASPNumberDescriptionMixin:
     """Mixin to describe a HASP Number entity."""
 
     command_topic: str
-    state_topic: str
+    state_subtopic: str
 
 
 @dataclass
@@ -38,7 +37,7 @@ NUMBERS = [
         native_min_value=1,
         native_max_value=12,
         command_topic="/command/page",
-        state_topic="/state/page",
+        state_subtopic="page",
     )
 ]
 
@@ -75,12 +74,9 @@ class HASPNumber(HASPEntity, NumberEntity, RestoreEntity):
 
     async def refresh(self):
         """Sync local state back to plate."""
-        await async_publish(
-            self.hass,
+        await self.async_publish_state(
             f"{self._topic}{self.entity_description.command_topic}",
             "" if self._number is None else self._number,
-            qos=0,
-            retain=False,
         )
         _LOGGER.debug("refresh %s with <%s>", self.entity_id, self._number)
         self.async_write_ha_state()
@@ -90,20 +86,18 @@ class HASPNumber(HASPEntity, NumberEntity, RestoreEntity):
         await super().async_added_to_hass()
 
         @callback
-        async def page_state_message_received(msg):
+        def page_state_message_received(number):
             """Process State."""
 
             self._available = True
-            _LOGGER.debug("%s current value = %s", self.entity_id, msg.payload)
+            _LOGGER.debug("%s current value = %s", self.entity_id, number)
 
-            self._number = int(msg.payload)
+            self._number = number
             self.async_write_ha_state()
 
         self._subscriptions.append(
-            await async_subscribe(
-                self.hass,
-                f"{self._topic}{self.entity_description.state_topic}",
-                page_state_message_received,
+            await async_get_channel(self.hass, self._topic).async_listen(
+                self.entity_description.state_subtopic, page_state_message_received
             )
         )
 
@@ -0,0 +1,219 @@
+"""Support for groups of plates sharing a command topic."""
+import asyncio
+import logging
+
+from homeassistant.components.mqtt import async_publish
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import callback
+from homeassistant.helpers import entity_platform
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.util import slugify
+
+from . import (
+    CLEAR_PAGE_SCHEMA,
+    COMMAND_SCHEMA,
+    CONFIG_SERVICE_SCHEMA,
+    PAGE_CHANGE_SCHEMA,
+)
+from .const import (
+    CONF_GROUPS,
+    CONF_PLATE,
+    CONF_PLATES,
+    CONF_TOPIC,
+    DATA_GROUPS,
+    DOMAIN,
+    SERVICE_GROUP_CLEAR_PAGE,
+    SERVICE_GROUP_COMMAND,
+    SERVICE_GROUP_CONFIG,
+    SERVICE_GROUP_PAGE_CHANGE,
+    SIGNAL_PLATES_CHANGED,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
+    """Set up the plate groups of the YAML configuration."""
+    if discovery_info is None:
+        return
+
+    # Only the services that can be sent on a group topic
+    platform = entity_platform.async_get_current_platform()
+    for service, schema, method in (
+        (SERVICE_GROUP_PAGE_CHANGE, PAGE_CHANGE_SCHEMA, "async_change_page"),
+        (SERVICE_GROUP_CLEAR_PAGE, CLEAR_PAGE_SCHEMA, "async_clearpage"),
+        (SERVICE_GROUP_COMMAND, COMMAND_SCHEMA, "async_command_service"),
+        (SERVICE_GROUP_CONFIG, CONFIG_SERVICE_SCHEMA, "async_config_service"),
+    ):
+        platform.async_register_entity_service(service, schema, method)
+
+    groups = {}
+
+    async def async_update_groups(config):
+        """Add, update and remove the groups to match the configuration."""
+        for name in set(groups) - set(config):
+            await groups.pop(name).async_remove()
+
+        added = []
+        for name, group_config in config.items():
+            if name in groups:
+                groups[name].async_update_config(group_config)
+            else:
+                groups[name] = HASPPlateGroup(name, group_config)
+                added.append(groups[name])
+
+        if added:
+            async_add_entities(added)
+
+    hass.data[DOMAIN][DATA_GROUPS] = async_update_groups
+    await async_update_groups(discovery_info[CONF_GROUPS])
+
+
+def listens_on(plate_entity, topic):
+    """Return True if the plate receives the commands published on topic.
+
+    A plate listens on the broadcast topic of its own topic prefix, and on the
+    group topic declared in its configuration.
+    """
+    prefix = plate_entity.topic.rpartition("/")[0]
+    return topic in (plate_entity.group_topic, f"{prefix}/broadcast")
+
+
+class HASPPlateGroup(SensorEntity):
+    """Representation of a group of openHASP plates.
+
+    Commands are published once on the group topic when it reaches exactly
+    the member plates known to Home Assistant. Members that don't listen on
+    it get the command one by one.
+    """
+
+    _attr_should_poll = False
+    _attr_icon = "mdi:view-grid"
+
+    def __init__(self, name, config):
+        """Initialize a plate group."""
+        self._plates = config[CONF_PLATES]
+        self._topic = config.get(CONF_TOPIC)
+        self._attr_name = name
+        self._attr_unique_id = f"group.{name}"
+
+    @property
+    def native_value(self):
+        """Return the number of plates of the group."""
+        return len(self._members())
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        return {CONF_PLATES: self._plates, CONF_TOPIC: self._topic}
+
+    async def async_added_to_hass(self):
+        """Run when entity about to be added."""
+        await super().async_added_to_hass()
+
+        @callback
+        def plates_changed():
+            """Update the group when plates are added or removed."""
+            self.async_write_ha_state()
+
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_PLATES_CHANGED, plates_changed)
+        )
+
+    @callback
+    def async_update_config(self, config):
+        """Apply a reloaded configuration."""
+        self._plates = config[CONF_PLATES]
+        self._topic = config.get(CONF_TOPIC)
+        self.async_write_ha_state()
+
+    def _members(self):
+        """Return the plate entities of the group."""
+        return [
+            plate_entity
+            for plate, plate_entity in self.hass.data[DOMAIN][CONF_PLATE].items()
+            if slugify(plate) in self._plates
+        ]
+
+    def _split_members(self):
+        """Return the members reached by the group topic and the others."""
+        members = self._members()
+        if not self._topic:
+            return [], members
+
+        outsiders = [
+            plate_entity
+            for plate_entity in self.hass.data[DOMAIN][CONF_PLATE].values()
+            if plate_entity not in members and listens_on(plate_entity, self._topic)
+        ]
+        if outsiders:
+            _LOGGER.debug(
+                "%s: %s also listen on %s, sending to plates one by one",
+                self.name,
+                [plate_entity.name for plate_entity in outsiders],
+                self._topic,
+            )
+            return [], members
+
+        reached = [p for p in members if listens_on(p, self._topic)]
+        return reached, [p for p in members if p not in reached]
+
+    async def _async_fan_out(self, publish, plate_service):
+        """Publish on the group topic, run plate_service for the other plates."""
+        reached, fallback = self._split_members()
+
+        if reached:
+            await publish(self._topic)
+
+        if fallback:
+            _LOGGER.debug(
+                "%s: sending to %s plates one by one", self.name, len(fallback)
+            )
+            await asyncio.gather(
+                *(plate_service(plate_entity) for plate_entity in fallback)
+            )
+
+    async def _async_publish(self, topic, payload):
+        """Publish a message."""
+        await async_publish(self.hass, topic, payload, qos=0, retain=False)
+
+    async def async_clearpage(self, page="all"):
+        """Clear page on all plates of the group."""
+
+        async def publish(topic):
+            await self._async_publish(f"{topic}/command", f"clearpage {page}")
+            if page == "all":
+                await self._async_publish(f"{topic}/command", "page 1")
+
+        await self._async_fan_out(
+            publish, lambda plate_entity: plate_entity.async_clearpage(page)
+        )
+
+    async def async_change_page(self, page):
+        """Change page to number on all plates of the group."""
+        await self._async_fan_out(
+            lambda topic: self._async_publish(f"{topic}/command/page", page),
+            lambda plate_entity: plate_entity.async_change_page(page),
+        )
+
+    async def async_command_service(self, keyword, parameters):
+        """Send commands to all plates of the group."""
+        await self._async_fan_out(
+            lambda topic: self._async_publish(
+                f"{topic}/command", f"{keyword} {parameters}".strip()
+            ),
+            lambda plate_entity: plate_entity.async_command_service(
+                keyword, parameters
+            ),
+        )
+
+    async def async_config_service(self, submodule, parameters):
+        """Send configuration commands to all plates of the group."""
+        await self._async_fan_out(
+            lambda topic: self._async_publish(
+                f"{topic}/config/{submodule}", f"{parameters}".strip()
+            ),
+            lambda plate_entity: plate_entity.async_config_service(
+                submodule, parameters
+            ),
+        )
@@ -4,7 +4,7 @@ import logging
 from typing import Callable
 
 # pylint: disable=R0801
-from homeassistant.components.mqtt import async_publish, async_subscribe
+from homeassistant.components.mqtt import async_publish
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
@@ -12,8 +12,9 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import EntityCategory
 import voluptuous as vol
 
-from .common import HASPToggleEntity
+from .common import HASPToggleEntity, async_get_router
 from .const import CONF_HWID, CONF_RELAYS, CONF_TOPIC
+from .decode import decode_state
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -67,12 +68,9 @@ class HASPSwitch(HASPToggleEntity):
             # Don't do anything before we know the state
             return
 
-        await async_publish(
-            self.hass,
+        await self.async_publish_state(
             f"{self._topic}/command/output{self._gpio}",
             json.dumps(HASP_RELAY_SCHEMA({"state": int(self._state)})),
-            qos=0,
-            retain=False,
         )
         self.async_write_ha_state()
 
@@ -86,7 +84,7 @@ class HASPSwitch(HASPToggleEntity):
 
             try:
                 self._available = True
-                message = HASP_RELAY_SCHEMA(json.loads(msg.payload))
+                message = decode_state(msg.payload)
                 _LOGGER.debug("%s state = %s", self.name, message)
 
                 self._state = message["state"]
@@ -96,10 +94,8 @@ class HASPSwitch(HASPToggleEntity):
                 _LOGGER.error(err)
 
         self._subscriptions.append(
-            await async_subscribe(
-                self.hass,
-                f"{self._topic}/state/output{self._gpio}",
-                relay_state_message_received,
+            await async_get_router(self.hass, self._topic).async_subscribe(
+                f"output{self._gpio}", relay_state_message_received
             )
         )
 
@@ -125,13 +121,10 @@ class HASPAntiBurn(HASPToggleEntity):
 
     async def refresh(self):
         """Sync local state back to plate."""
-        await async_publish(
-            self.hass,
+        await self.async_publish_state(
             f"{self._topic}/command/antiburn",
             int(self._state),
             # json.dumps(HASP_RELAY_SCHEMA({"state": int(self._state)})),
-            qos=0,
-            retain=False,
         )
         self.async_write_ha_state()
 
@@ -145,7 +138,7 @@ class HASPAntiBurn(HASPToggleEntity):
 
             try:
                 self._available = True
-                message = HASP_RELAY_SCHEMA(json.loads(msg.payload))
+                message = decode_state(msg.payload)
                 _LOGGER.debug("%s state = %s", self.name, message)
 
                 self._state = message["state"]
@@ -155,10 +148,8 @@ class HASPAntiBurn(HASPToggleEntity):
                 _LOGGER.error(err)
 
         self._subscriptions.append(
-            await async_subscribe(
-                self.hass,
-                f"{self._topic}/state/antiburn",
-                antiburn_state_message_received,
+            await async_get_router(self.hass, self._topic).async_subscribe(
+                "antiburn", antiburn_state_message_received
             )
         )
 
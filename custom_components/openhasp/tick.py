@@ -0,0 +1,91 @@
+"""Shared time tick for templates that only depend on now()."""
+from collections import defaultdict
+import logging
+
+from homeassistant.core import callback
+from homeassistant.exceptions import TemplateError
+from homeassistant.helpers.event import async_track_utc_time_change
+
+from .common import async_get_write_buffer
+from .const import DATA_TIME_TICK, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_time_tick(hass):
+    """Return the time tick shared by all plates."""
+    if DATA_TIME_TICK not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_TIME_TICK] = HASPTimeTick(hass)
+    return hass.data[DOMAIN][DATA_TIME_TICK]
+
+
+class HASPTimeTick:
+    """Minute aligned tick rendering all time dependent properties in one batch."""
+
+    def __init__(self, hass):
+        """Initialize the time tick."""
+        self.hass = hass
+        self._objects = {}
+        self._unsub = None
+
+    @callback
+    def async_add(self, obj, _property, template):
+        """Render the object property on every tick."""
+        self._objects.setdefault(obj, {})[_property] = template
+
+        if self._unsub is None:
+            self._unsub = async_track_utc_time_change(
+                self.hass, self._async_tick, second=0
+            )
+
+    @callback
+    def async_remove(self, obj):
+        """Stop rendering the properties of an object."""
+        self._objects.pop(obj, None)
+
+        if not self._objects and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_tick(self, now):
+        """Render all registered templates and send the changed results."""
+        results = {}
+        updates = defaultdict(list)
+
+        for obj, properties in self._objects.items():
+            for _property, template in properties.items():
+                # Identical templates are rendered only once per tick
+                if template.template not in results:
+                    try:
+                        results[template.template] = template.async_render()
+                    except TemplateError as err:
+                        _LOGGER.error(
+                            "TemplateError('%s') while processing template '%s'",
+                            err,
+                            template,
+                        )
+                        results[template.template] = None
+
+                result = results[template.template]
+                if result is None or obj.cached_properties.get(_property) == result:
+                    continue
+
+                if not obj.async_cache_property(_property, result):
+                    continue
+
+                updates[obj.plate_topic].append((obj, _property, result))
+
+        _LOGGER.debug(
+            "Time tick rendered %s templates, %s plates to update",
+            len(results),
+            len(updates),
+        )
+
+        for topic, plate_updates in updates.items():
+            self.hass.async_create_task(
+                async_get_write_buffer(self.hass, topic).async_publish_properties(
+                    plate_updates
+                )
+            )
@@ -0,0 +1,119 @@
+"""Transfer of files to the plate filesystem over HTTP."""
+import asyncio
+import hashlib
+import logging
+import os
+
+from homeassistant.const import CONF_NAME, CONF_PATH
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+import aiohttp
+
+from .const import DOMAIN, STORAGE_VERSION, UPLOAD_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def plate_url(url, path=""):
+    """Return the URL of a path on the plate web server."""
+    return f"{url.rstrip('/')}/{path.lstrip('/')}"
+
+
+async def async_upload_file(session, url, filename, data):
+    """Upload data as filename to the plate filesystem.
+
+    Raises aiohttp.ClientError or asyncio.TimeoutError on failure.
+    """
+    form = aiohttp.FormData()
+    form.add_field(
+        "file", data, filename=filename, content_type="application/octet-stream"
+    )
+
+    _LOGGER.debug("Upload %s bytes to %s%s", len(data), url, filename)
+    async with session.post(
+        plate_url(url, "edit"),
+        data=form,
+        timeout=aiohttp.ClientTimeout(total=UPLOAD_TIMEOUT),
+    ) as response:
+        response.raise_for_status()
+
+
+def file_digest(path):
+    """Return the sha256 digest of a file, executor helper."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as src_file:
+        for chunk in iter(lambda: src_file.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_bytes(path):
+    """Return the content of a file, executor helper."""
+    with open(path, "rb") as src_file:
+        return src_file.read()
+
+
+class HASPAssetSync:
+    """Keep the assets on a plate filesystem in sync with the configuration.
+
+    A manifest of the content hashes uploaded to the plate is stored, only
+    files that changed since are transferred.
+    """
+
+    def __init__(self, hass, hwid, assets):
+        """Initialize the asset sync of a plate."""
+        self.hass = hass
+        self.assets = assets
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{hwid}.assets")
+        self._manifest = None
+
+    async def async_forget(self):
+        """Forget the uploaded assets, the plate filesystem was erased."""
+        self._manifest = {}
+        await self._store.async_remove()
+
+    async def async_sync(self, url):
+        """Upload the changed assets to the plate, return the number uploaded."""
+        if self._manifest is None:
+            self._manifest = await self._store.async_load() or {}
+
+        session = async_get_clientsession(self.hass)
+        names = set()
+        uploaded = 0
+        try:
+            for asset in self.assets:
+                path = asset[CONF_PATH]
+                name = asset.get(CONF_NAME) or f"/{os.path.basename(path)}"
+                names.add(name)
+
+                if not self.hass.config.is_allowed_path(path):
+                    _LOGGER.error("'%s' is not an allowed directory", path)
+                    continue
+
+                try:
+                    digest = await self.hass.async_add_executor_job(file_digest, path)
+                except OSError as err:
+                    _LOGGER.error("Error reading asset %s: %s", path, err)
+                    continue
+
+                if self._manifest.get(name) == digest:
+                    continue
+
+                data = await self.hass.async_add_executor_job(read_bytes, path)
+                await async_upload_file(session, url, name, data)
+                self._manifest[name] = digest
+                uploaded += 1
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.warning("Upload of assets to %s failed: %s", url, err)
+            stale = set()
+        else:
+            # Forget the assets no longer configured
+            stale = set(self._manifest) - names
+            for name in stale:
+                del self._manifest[name]
+
+        if uploaded or stale:
+            await self._store.async_save(self._manifest)
+
+        _LOGGER.debug("%s of %s assets uploaded to %s", uploaded, len(names), url)
+        return uploaded
@@ -0,0 +1,121 @@
+"""Tests of the file upload to the plate web server."""
+import asyncio
+import socket
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from aiohttp import ClientResponseError, ClientSession, web
+import pytest
+
+from custom_components.openhasp import SwitchPlate
+from custom_components.openhasp.const import DISCOVERED_URL, HASP_PAGES_FILE
+from custom_components.openhasp.upload import async_upload_file
+
+PAGES = ['{"page":1,"id":1,"obj":"btn","text":"Hello"}\n']
+
+
+class PlateServer:
+    """Stand-in for the plate web server."""
+
+    def __init__(self, status=200):
+        """Initialize the server."""
+        self.status = status
+        self.uploads = []
+        self._runner = None
+        self.url = None
+
+    async def _handle_edit(self, request):
+        """Store the uploaded files, like the plate file editor."""
+        reader = await request.multipart()
+        async for part in reader:
+            self.uploads.append((part.name, part.filename, await part.read()))
+        return web.Response(status=self.status)
+
+    async def __aenter__(self):
+        """Start the server on a free local port."""
+        app = web.Application()
+        app.router.add_post("/edit", self._handle_edit)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        await web.SockSite(self._runner, sock).start()
+        self.url = f"http://127.0.0.1:{sock.getsockname()[1]}/"
+        return self
+
+    async def __aexit__(self, *exc):
+        """Stop the server."""
+        await self._runner.cleanup()
+
+
+def _plate(url, session):
+    """Return a plate uploading its pages to url."""
+    plate = SwitchPlate.__new__(SwitchPlate)
+    plate.hass = SimpleNamespace(session=session)
+    plate._entry = SimpleNamespace(data={"name": "plate", DISCOVERED_URL: url})
+    plate._topic = "hasp/plate"
+    plate._upload_pages = True
+    plate._design_fingerprint = None
+    plate.async_prepare_pages = AsyncMock(return_value=list(PAGES))
+    return plate
+
+
+def test_upload_file():
+    """Test the file is posted as multipart to /edit."""
+
+    async def run():
+        async with PlateServer() as server, ClientSession() as session:
+            await async_upload_file(session, server.url, HASP_PAGES_FILE, b"data")
+        return server.uploads
+
+    assert asyncio.run(run()) == [("file", HASP_PAGES_FILE, b"data")]
+
+
+def test_upload_file_error():
+    """Test an error of the plate is raised."""
+
+    async def run():
+        async with PlateServer(status=500) as server, ClientSession() as session:
+            await async_upload_file(session, server.url, HASP_PAGES_FILE, b"data")
+
+    with pytest.raises(ClientResponseError):
+        asyncio.run(run())
+
+
+def _run_send_pages(status):
+    """Send pages to a plate server answering with status, return the publishes."""
+
+    async def run():
+        async with PlateServer(status=status) as server, ClientSession() as session:
+            plate = _plate(server.url, session)
+            with patch(
+                "custom_components.openhasp.async_get_clientsession",
+                side_effect=lambda hass: hass.session,
+            ), patch(
+                "custom_components.openhasp.async_publish", new_callable=AsyncMock
+            ) as publish:
+                assert await plate.async_send_pages("/config/pages.jsonl")
+            return server.uploads, [call.args[1:3] for call in publish.call_args_list]
+
+    return asyncio.run(run())
+
+
+def test_send_pages_upload():
+    """Test pages are uploaded with the fingerprint, then run by the plate."""
+    uploads, publishes = _run_send_pages(200)
+
+    assert len(uploads) == 1
+    name, filename, data = uploads[0]
+    assert (name, filename) == ("file", HASP_PAGES_FILE)
+    assert data.decode().startswith(PAGES[0])
+    assert '"hidden": 1' in data.decode()
+    assert publishes == [("hasp/plate/command", f"run L:{HASP_PAGES_FILE}")]
+
+
+def test_send_pages_upload_fallback():
+    """Test pages are sent over MQTT when the upload fails."""
+    uploads, publishes = _run_send_pages(500)
+
+    assert len(uploads) == 1
+    assert [topic for topic, _ in publishes] == ["hasp/plate/command/jsonl"]
+    assert publishes[0][1].startswith(PAGES[0])